@@ -32,6 +32,8 @@ class BleakGATTCharacteristicBlueZDBus(BleakGATTCharacteristic):
     def __init__(self, obj: dict, object_path: str, service_uuid: str):
         super(BleakGATTCharacteristicBlueZDBus, self).__init__(obj)
         self.__descriptors = []
+        self.__descriptors_by_handle = {}
+        self.__descriptors_by_uuid = {}
         self.__path = object_path
         self.__service_uuid = service_uuid
 
@@ -70,15 +72,9 @@ class BleakGATTCharacteristicBlueZDBus(BleakGATTCharacteristic):
         self, specifier: Union[int, str, UUID]
     ) -> Union[BleakGATTDescriptor, None]:
         """Get a descriptor by handle (int) or UUID (str or uuid.UUID)"""
-        try:
-            if isinstance(specifier, int):
-                return next(filter(lambda x: x.handle == specifier, self.descriptors))
-            else:
-                return next(
-                    filter(lambda x: x.uuid == str(specifier), self.descriptors)
-                )
-        except StopIteration:
-            return None
+        if isinstance(specifier, int):
+            return self.__descriptors_by_handle.get(specifier)
+        return self.__descriptors_by_uuid.get(str(specifier))
 
     def add_descriptor(self, descriptor: BleakGATTDescriptor):
         """Add a :py:class:`~BleakGATTDescriptor` to the characteristic.
@@ -86,6 +82,8 @@ class BleakGATTCharacteristicBlueZDBus(BleakGATTCharacteristic):
         Should not be used by end user, but rather by `bleak` itself.
         """
         self.__descriptors.append(descriptor)
+        self.__descriptors_by_handle.setdefault(descriptor.handle, descriptor)
+        self.__descriptors_by_uuid.setdefault(descriptor.uuid, descriptor)
 
     @property
     def path(self) -> str:
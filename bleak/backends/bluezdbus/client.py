@@ -9,7 +9,7 @@ import re
 import subprocess
 import uuid
 import warnings
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Callable, Union
 
 from twisted.internet.error import ConnectionDone
@@ -31,6 +31,25 @@ from txdbus.error import RemoteError
 
 logger = logging.getLogger(__name__)
 
+# Services of previous connections by D-Bus device path, for clients that opt
+# in with ``dangerous_use_bleak_cache``. Each entry is a (GATT objects, services)
+# pair, the first being what ``_gatt_objects_key`` gave when it was stored.
+_services_cache = {}
+
+# Options of Characteristic.WriteValue, shared by all writes of either type.
+_WRITE_WITH_RESPONSE_OPTIONS = {"type": "request"}
+_WRITE_WITHOUT_RESPONSE_OPTIONS = {"type": "command"}
+
+
+@lru_cache(maxsize=None)
+def _get_bluez_version() -> tuple:
+    # The BlueZ version does not change while Python runs, so bluetoothctl is
+    # only started for the first client instead of in every constructor.
+    p = subprocess.Popen(["bluetoothctl", "--version"], stdout=subprocess.PIPE)
+    out, _ = p.communicate()
+    s = re.search(b"(\\d+).(\\d+)", out.strip(b"'"))
+    return tuple(map(int, s.groups()))
+
 
 class BleakClientBlueZDBus(BaseBleakClient):
     """A native Linux Bleak Client
@@ -62,18 +81,23 @@ class BleakClientBlueZDBus(BaseBleakClient):
             self._device_info = None
         self._bus = None
         self._reactor = None
+        self._loop = None
         self._rules = {}
         self._subscriptions = list()
-
-        # This maps DBus paths of GATT Characteristics to their BLE handles.
-        self._char_path_to_handle = {}
+        # Connection state last reported by BlueZ to this client.
+        self._connected = False
 
         # We need to know BlueZ version since battery level characteristic
         # are stored in a separate DBus interface in the BlueZ >= 5.48.
-        p = subprocess.Popen(["bluetoothctl", "--version"], stdout=subprocess.PIPE)
-        out, _ = p.communicate()
-        s = re.search(b"(\\d+).(\\d+)", out.strip(b"'"))
-        self._bluez_version = tuple(map(int, s.groups()))
+        self._bluez_version = _get_bluez_version()
+        # The write method to use is decided once here instead of on every
+        # write. See `write_gatt_char` for details.
+        self._write_without_response_supported = not (
+            self._bluez_version[0] == 5 and self._bluez_version[1] < 46
+        )
+        self._write_value_has_type_option = (
+            self._bluez_version[0] == 5 and self._bluez_version[1] > 50
+        )
 
     # Connectivity methods
 
@@ -82,6 +106,10 @@ class BleakClientBlueZDBus(BaseBleakClient):
 
         Keyword Args:
             timeout (float): Timeout for required ``BleakScanner.find_device_by_address`` call. Defaults to 10.0.
+            dangerous_use_bleak_cache (bool): If set to `True`, the services found on a
+                previous connection to this device are reused instead of waiting for
+                BlueZ to resolve them again. See :py:meth:`get_services`.
+                Defaults to `False`.
 
         Returns:
             Boolean representing connection status.
@@ -103,7 +131,9 @@ class BleakClientBlueZDBus(BaseBleakClient):
                     "Device with address {0} was not found.".format(self.address)
                 )
 
-        loop = asyncio.get_event_loop()
+        # The bus and its reactor belong to this loop, so later D-Bus calls
+        # reuse it instead of looking up the current loop each time.
+        loop = self._loop = asyncio.get_event_loop()
         self._reactor = get_reactor(loop)
 
         # Create system bus
@@ -125,9 +155,7 @@ class BleakClientBlueZDBus(BaseBleakClient):
         )
 
         logger.debug(
-            "Connecting to BLE device @ {0} with {1}".format(
-                self.address, self._adapter
-            )
+            "Connecting to BLE device @ %s with %s", self.address, self._adapter
         )
         try:
             await self._bus.callRemote(
@@ -150,6 +178,7 @@ class BleakClientBlueZDBus(BaseBleakClient):
                 raise BleakError(str(e))
 
         if await self.is_connected():
+            self._connected = True
             logger.debug("Connection successful.")
         else:
             await self._cleanup_all()
@@ -158,7 +187,9 @@ class BleakClientBlueZDBus(BaseBleakClient):
             )
 
         # Get all services. This means making the actual connection.
-        await self.get_services()
+        await self.get_services(
+            dangerous_use_bleak_cache=kwargs.get("dangerous_use_bleak_cache", False)
+        )
         properties = await self._get_device_properties()
         if not properties.get("Connected"):
             await self._cleanup_all()
@@ -176,9 +207,9 @@ class BleakClientBlueZDBus(BaseBleakClient):
         free the DBus matches that have been established.
         """
         for rule_name, rule_id in self._rules.items():
-            logger.debug("Removing rule {0}, ID: {1}".format(rule_name, rule_id))
+            logger.debug("Removing rule %s, ID: %s", rule_name, rule_id)
             try:
-                await self._bus.delMatch(rule_id).asFuture(asyncio.get_event_loop())
+                await self._bus.delMatch(rule_id).asFuture(self._loop)
             except Exception as e:
                 logger.error(
                     "Could not remove rule {0} ({1}): {2}".format(rule_id, rule_name, e)
@@ -217,7 +248,6 @@ class BleakClientBlueZDBus(BaseBleakClient):
         Free all the allocated resource in DBus and Twisted. Use this method to
         eventually cleanup all otherwise leaked resources.
         """
-        self._char_path_to_handle.clear()
         await self._cleanup_notifications()
         await self._cleanup_dbus_resources()
 
@@ -245,11 +275,15 @@ class BleakClientBlueZDBus(BaseBleakClient):
                 "Disconnect",
                 interface=defs.DEVICE_INTERFACE,
                 destination=defs.BLUEZ_SERVICE,
-            ).asFuture(asyncio.get_event_loop())
+            ).asFuture(self._loop)
         except Exception as e:
             logger.error("Attempt to disconnect device failed: {0}".format(e))
+        else:
+            # BlueZ only replies to Disconnect once the device is disconnected.
+            self._connected = False
 
-        is_disconnected = not await self.is_connected()
+        # The connection state only needs querying if Disconnect failed.
+        is_disconnected = not self._connected or not await self.is_connected()
 
         await self._cleanup_dbus_resources()
 
@@ -269,7 +303,7 @@ class BleakClientBlueZDBus(BaseBleakClient):
             Boolean regarding success of pairing.
 
         """
-        loop = asyncio.get_event_loop()
+        loop = self._loop
 
         # See if it is already paired.
         is_paired = await self._bus.callRemote(
@@ -280,7 +314,7 @@ class BleakClientBlueZDBus(BaseBleakClient):
             signature="ss",
             body=[defs.DEVICE_INTERFACE, "Paired"],
             returnSignature="v",
-        ).asFuture(asyncio.get_event_loop())
+        ).asFuture(self._loop)
         if is_paired:
             return is_paired
 
@@ -293,11 +327,9 @@ class BleakClientBlueZDBus(BaseBleakClient):
             signature="ssv",
             body=[defs.DEVICE_INTERFACE, "Trusted", True],
             returnSignature="",
-        ).asFuture(asyncio.get_event_loop())
+        ).asFuture(self._loop)
 
-        logger.debug(
-            "Pairing to BLE device @ {0} with {1}".format(self.address, self._adapter)
-        )
+        logger.debug("Pairing to BLE device @ %s with %s", self.address, self._adapter)
         try:
             await self._bus.callRemote(
                 self._device_path,
@@ -319,7 +351,7 @@ class BleakClientBlueZDBus(BaseBleakClient):
             signature="ss",
             body=[defs.DEVICE_INTERFACE, "Paired"],
             returnSignature="v",
-        ).asFuture(asyncio.get_event_loop())
+        ).asFuture(self._loop)
 
     async def unpair(self) -> bool:
         """Unpair with the peripheral.
@@ -351,7 +383,7 @@ class BleakClientBlueZDBus(BaseBleakClient):
                 signature="ss",
                 body=[defs.DEVICE_INTERFACE, "Connected"],
                 returnSignature="v",
-            ).asFuture(asyncio.get_event_loop())
+            ).asFuture(self._loop)
         except AttributeError:
             # The `self._bus` object had already been cleaned up due to disconnect...
             pass
@@ -365,9 +397,18 @@ class BleakClientBlueZDBus(BaseBleakClient):
 
     # GATT services methods
 
-    async def get_services(self) -> BleakGATTServiceCollection:
+    async def get_services(
+        self, dangerous_use_bleak_cache=False, **kwargs
+    ) -> BleakGATTServiceCollection:
         """Get all services registered for this GATT server.
 
+        Args:
+            dangerous_use_bleak_cache (bool): If `True`, the services found on a
+                previous connection to this device are returned without waiting
+                for BlueZ to resolve them, as long as BlueZ still exposes the same
+                GATT objects for the device. Services that changed without BlueZ
+                noticing yet are not detected. Defaults to `False`.
+
         Returns:
            A :py:class:`bleak.backends.service.BleakGATTServiceCollection` with this device's services tree.
 
@@ -375,6 +416,16 @@ class BleakClientBlueZDBus(BaseBleakClient):
         if self._services_resolved:
             return self.services
 
+        if dangerous_use_bleak_cache and self._device_path in _services_cache:
+            gatt_objects, services = _services_cache[self._device_path]
+            objs = await get_managed_objects(self._bus, self._device_path + "/service")
+            if _gatt_objects_key(objs) == gatt_objects:
+                logger.debug("Using cached services for %s", self._device_path)
+                self.services = services
+                self._services_resolved = True
+                return self.services
+            del _services_cache[self._device_path]
+
         sleep_loop_sec = 0.02
         total_slept_sec = 0
         services_resolved = False
@@ -397,15 +448,13 @@ class BleakClientBlueZDBus(BaseBleakClient):
         # Managed Objects dict.
         # Need multiple iterations to construct the Service Collection
 
-        _chars, _descs = [], []
+        _services, _chars, _descs = [], [], []
 
         for object_path, interfaces in objs.items():
             logger.debug(utils.format_GATT_object(object_path, interfaces))
             if defs.GATT_SERVICE_INTERFACE in interfaces:
                 service = interfaces.get(defs.GATT_SERVICE_INTERFACE)
-                self.services.add_service(
-                    BleakGATTServiceBlueZDBus(service, object_path)
-                )
+                _services.append(BleakGATTServiceBlueZDBus(service, object_path))
             elif defs.GATT_CHARACTERISTIC_INTERFACE in interfaces:
                 char = interfaces.get(defs.GATT_CHARACTERISTIC_INTERFACE)
                 _chars.append([char, object_path])
@@ -413,31 +462,32 @@ class BleakClientBlueZDBus(BaseBleakClient):
                 desc = interfaces.get(defs.GATT_DESCRIPTOR_INTERFACE)
                 _descs.append([desc, object_path])
 
+        services_by_path = {service.path: service for service in _services}
+        characteristics_by_path = {}
         for char, object_path in _chars:
-            _service = list(filter(lambda x: x.path == char["Service"], self.services))
-            self.services.add_characteristic(
-                BleakGATTCharacteristicBlueZDBus(char, object_path, _service[0].uuid)
+            characteristics_by_path[object_path] = BleakGATTCharacteristicBlueZDBus(
+                char, object_path, services_by_path[char["Service"]].uuid
             )
 
-            # D-Bus object path contains handle as last 4 characters of 'charYYYY'
-            self._char_path_to_handle[object_path] = int(object_path[-4:], 16)
-
+        descriptors = []
         for desc, object_path in _descs:
-            _characteristic = list(
-                filter(
-                    lambda x: x.path == desc["Characteristic"],
-                    self.services.characteristics.values(),
-                )
-            )
-            self.services.add_descriptor(
+            _characteristic = characteristics_by_path[desc["Characteristic"]]
+            descriptors.append(
                 BleakGATTDescriptorBlueZDBus(
                     desc,
                     object_path,
-                    _characteristic[0].uuid,
-                    int(_characteristic[0].handle),
+                    _characteristic.uuid,
+                    int(_characteristic.handle),
                 )
             )
 
+        self.services.add_all(_services, characteristics_by_path.values(), descriptors)
+        if dangerous_use_bleak_cache:
+            _services_cache[self._device_path] = (
+                _gatt_objects_key(objs),
+                self.services,
+            )
+
         self._services_resolved = True
         return self.services
 
@@ -474,11 +524,14 @@ class BleakClientBlueZDBus(BaseBleakClient):
                     interface=defs.BATTERY_INTERFACE
                 )
                 # Simulate regular characteristics read to be consistent over all platforms.
-                value = bytearray([props.get("Percentage", "")])
+                value = bytearray(
+                    [props["Percentage"]] if "Percentage" in props else []
+                )
                 logger.debug(
-                    "Read Battery Level {0} | {1}: {2}".format(
-                        char_specifier, self._device_path, value
-                    )
+                    "Read Battery Level %s | %s: %s",
+                    char_specifier,
+                    self._device_path,
+                    value,
                 )
                 return value
             if str(char_specifier) == "00002a00-0000-1000-8000-00805f9b34fb" and (
@@ -490,9 +543,10 @@ class BleakClientBlueZDBus(BaseBleakClient):
                 # Simulate regular characteristics read to be consistent over all platforms.
                 value = bytearray(props.get("Alias", "").encode("ascii"))
                 logger.debug(
-                    "Read Device Name {0} | {1}: {2}".format(
-                        char_specifier, self._device_path, value
-                    )
+                    "Read Device Name %s | %s: %s",
+                    char_specifier,
+                    self._device_path,
+                    value,
                 )
                 return value
 
@@ -511,13 +565,14 @@ class BleakClientBlueZDBus(BaseBleakClient):
                 signature="a{sv}",
                 body=[{}],
                 returnSignature="ay",
-            ).asFuture(asyncio.get_event_loop())
+            ).asFuture(self._loop)
         )
 
         logger.debug(
-            "Read Characteristic {0} | {1}: {2}".format(
-                characteristic.uuid, characteristic.path, value
-            )
+            "Read Characteristic %s | %s: %s",
+            characteristic.uuid,
+            characteristic.path,
+            value,
         )
         return value
 
@@ -544,12 +599,10 @@ class BleakClientBlueZDBus(BaseBleakClient):
                 signature="a{sv}",
                 body=[{}],
                 returnSignature="ay",
-            ).asFuture(asyncio.get_event_loop())
+            ).asFuture(self._loop)
         )
 
-        logger.debug(
-            "Read Descriptor {0} | {1}: {2}".format(handle, descriptor.path, value)
-        )
+        logger.debug("Read Descriptor %s | %s: %s", handle, descriptor.path, value)
         return value
 
     async def write_gatt_char(
@@ -609,9 +662,9 @@ class BleakClientBlueZDBus(BaseBleakClient):
             )
 
         # See docstring for details about this handling.
-        if not response and self._bluez_version[0] == 5 and self._bluez_version[1] < 46:
+        if not response and not self._write_without_response_supported:
             raise BleakError("Write without response requires at least BlueZ 5.46")
-        if response or (self._bluez_version[0] == 5 and self._bluez_version[1] > 50):
+        if response or self._write_value_has_type_option:
             # TODO: Add OnValueUpdated handler for response=True?
             await self._bus.callRemote(
                 characteristic.path,
@@ -619,9 +672,14 @@ class BleakClientBlueZDBus(BaseBleakClient):
                 interface=defs.GATT_CHARACTERISTIC_INTERFACE,
                 destination=defs.BLUEZ_SERVICE,
                 signature="aya{sv}",
-                body=[data, {"type": "request" if response else "command"}],
+                body=[
+                    data,
+                    _WRITE_WITH_RESPONSE_OPTIONS
+                    if response
+                    else _WRITE_WITHOUT_RESPONSE_OPTIONS,
+                ],
                 returnSignature="",
-            ).asFuture(asyncio.get_event_loop())
+            ).asFuture(self._loop)
         else:
             # Older versions of BlueZ don't have the "type" option, so we have
             # to write the hard way. This isn't the most efficient way of doing
@@ -634,14 +692,15 @@ class BleakClientBlueZDBus(BaseBleakClient):
                 signature="a{sv}",
                 body=[{}],
                 returnSignature="hq",
-            ).asFuture(asyncio.get_event_loop())
+            ).asFuture(self._loop)
             os.write(fd, data)
             os.close(fd)
 
         logger.debug(
-            "Write Characteristic {0} | {1}: {2}".format(
-                characteristic.uuid, characteristic.path, data
-            )
+            "Write Characteristic %s | %s: %s",
+            characteristic.uuid,
+            characteristic.path,
+            data,
         )
 
     async def write_gatt_descriptor(self, handle: int, data: bytearray) -> None:
@@ -663,11 +722,9 @@ class BleakClientBlueZDBus(BaseBleakClient):
             signature="aya{sv}",
             body=[data, {"type": "command"}],
             returnSignature="",
-        ).asFuture(asyncio.get_event_loop())
+        ).asFuture(self._loop)
 
-        logger.debug(
-            "Write Descriptor {0} | {1}: {2}".format(handle, descriptor.path, data)
-        )
+        logger.debug("Write Descriptor %s | %s: %s", handle, descriptor.path, data)
 
     async def start_notify(
         self,
@@ -724,17 +781,19 @@ class BleakClientBlueZDBus(BaseBleakClient):
                 )
             )
 
+        # The handle is bound into the callback here rather than looked up from
+        # the D-Bus path on every notification.
         if _wrap:
             self._notification_callbacks[
                 characteristic.path
             ] = _data_notification_wrapper(
-                callback, self._char_path_to_handle
+                callback, characteristic.handle
             )  # noqa | E123 error in flake8...
         else:
             self._notification_callbacks[
                 characteristic.path
             ] = _regular_notification_wrapper(
-                callback, self._char_path_to_handle
+                callback, characteristic.handle
             )  # noqa | E123 error in flake8...
 
         self._subscriptions.append(characteristic.handle)
@@ -747,7 +806,7 @@ class BleakClientBlueZDBus(BaseBleakClient):
             signature="",
             body=[],
             returnSignature="",
-        ).asFuture(asyncio.get_event_loop())
+        ).asFuture(self._loop)
 
     async def stop_notify(
         self,
@@ -776,7 +835,7 @@ class BleakClientBlueZDBus(BaseBleakClient):
             signature="",
             body=[],
             returnSignature="",
-        ).asFuture(asyncio.get_event_loop())
+        ).asFuture(self._loop)
         self._notification_callbacks.pop(characteristic.path, None)
 
         self._subscriptions.remove(characteristic.handle)
@@ -815,7 +874,7 @@ class BleakClientBlueZDBus(BaseBleakClient):
             signature="s",
             body=[defs.GATT_CHARACTERISTIC_INTERFACE],
             returnSignature="a{sv}",
-        ).asFuture(asyncio.get_event_loop())
+        ).asFuture(self._loop)
         return out
 
     async def _get_device_properties(self, interface=defs.DEVICE_INTERFACE) -> dict:
@@ -836,7 +895,7 @@ class BleakClientBlueZDBus(BaseBleakClient):
             signature="s",
             body=[interface],
             returnSignature="a{sv}",
-        ).asFuture(asyncio.get_event_loop())
+        ).asFuture(self._loop)
 
     # Internal Callbacks
 
@@ -854,21 +913,21 @@ class BleakClientBlueZDBus(BaseBleakClient):
         """
 
         logger.debug(
-            "DBUS: path: {}, domain: {}, body: {}".format(
-                message.path, message.body[0], message.body[1]
-            )
+            "DBUS: path: %s, domain: %s, body: %s",
+            message.path,
+            message.body[0],
+            message.body[1],
         )
 
         if message.body[0] == defs.GATT_CHARACTERISTIC_INTERFACE:
-            if message.path in self._notification_callbacks:
+            notification_callback = self._notification_callbacks.get(message.path)
+            if notification_callback is not None:
                 logger.debug(
-                    "GATT Char Properties Changed: {0} | {1}".format(
-                        message.path, message.body[1:]
-                    )
-                )
-                self._notification_callbacks[message.path](
-                    message.path, message.body[1]
+                    "GATT Char Properties Changed: %s | %s",
+                    message.path,
+                    message.body[1:],
                 )
+                notification_callback(message.body[1])
         elif message.body[0] == defs.DEVICE_INTERFACE:
             device_path = "/org/bluez/%s/dev_%s" % (
                 self._adapter,
@@ -876,32 +935,50 @@ class BleakClientBlueZDBus(BaseBleakClient):
             )
             if message.path.lower() == device_path.lower():
                 message_body_map = message.body[1]
+                if "Connected" in message_body_map:
+                    self._connected = bool(message_body_map["Connected"])
                 if (
                     "Connected" in message_body_map
                     and not message_body_map["Connected"]
                 ):
-                    logger.debug("Device {} disconnected.".format(self.address))
+                    logger.debug("Device %s disconnected.", self.address)
 
-                    task = asyncio.get_event_loop().create_task(self._cleanup_all())
+                    task = self._loop.create_task(self._cleanup_all())
                     if self._disconnected_callback is not None:
                         task.add_done_callback(
                             lambda _: self._disconnected_callback(self)
                         )
 
 
-def _data_notification_wrapper(func, char_map):
+def _gatt_objects_key(objs):
+    """Returns the object paths and UUIDs of GATT objects, to compare discoveries."""
+    return frozenset(
+        (object_path, interface["UUID"])
+        for object_path, interfaces in objs.items()
+        for name, interface in interfaces.items()
+        if name
+        in (
+            defs.GATT_SERVICE_INTERFACE,
+            defs.GATT_CHARACTERISTIC_INTERFACE,
+            defs.GATT_DESCRIPTOR_INTERFACE,
+        )
+    )
+
+
+def _data_notification_wrapper(func, handle):
     @wraps(func)
-    def args_parser(sender, data):
-        if "Value" in data:
+    def args_parser(data):
+        value = data.get("Value")
+        if value is not None:
             # Do a conversion from {'Value': [...]} to bytearray.
-            return func(char_map.get(sender, sender), bytearray(data.get("Value")))
+            return func(handle, bytearray(value))
 
     return args_parser
 
 
-def _regular_notification_wrapper(func, char_map):
+def _regular_notification_wrapper(func, handle):
     @wraps(func)
-    def args_parser(sender, data):
-        return func(char_map.get(sender, sender), data)
+    def args_parser(data):
+        return func(handle, data)
 
     return args_parser
@@ -272,21 +272,27 @@ class BleakScannerBlueZDBus(BaseBleakScanner):
             and message.body[1][0] == defs.BATTERY_INTERFACE
         ):
             logger.debug(
-                "{0}, {1} ({2}): {3}".format(
-                    message.member, message.interface, message.path, message.body
-                )
+                "%s, %s (%s): %s",
+                message.member,
+                message.interface,
+                message.path,
+                message.body,
             )
             return
         else:
             msg_path = message.path
             logger.debug(
-                "{0}, {1} ({2}): {3}".format(
-                    message.member, message.interface, message.path, message.body
-                )
+                "%s, %s (%s): %s",
+                message.member,
+                message.interface,
+                message.path,
+                message.body,
             )
 
-        logger.debug(
-            "{0}, {1} ({2} dBm), Object Path: {3}".format(
+        # Reached for every advertisement while scanning without a callback;
+        # the device info is only gathered when it is actually logged.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "%s, %s (%s dBm), Object Path: %s",
                 *_device_info(msg_path, self._devices.get(msg_path))
             )
-        )
@@ -1,4 +1,5 @@
-from typing import List
+from typing import List, Union
+from uuid import UUID
 
 from bleak.backends.service import BleakGATTService
 from bleak.backends.bluezdbus.characteristic import BleakGATTCharacteristicBlueZDBus
@@ -10,6 +11,7 @@ class BleakGATTServiceBlueZDBus(BleakGATTService):
     def __init__(self, obj, path):
         super().__init__(obj)
         self.__characteristics = []
+        self.__characteristics_by_uuid = {}
         self.__path = path
 
     @property
@@ -28,6 +30,21 @@ class BleakGATTServiceBlueZDBus(BleakGATTService):
         Should not be used by end user, but rather by `bleak` itself.
         """
         self.__characteristics.append(characteristic)
+        self.__characteristics_by_uuid.setdefault(characteristic.uuid, characteristic)
+
+    def get_characteristic(
+        self, uuid: Union[str, UUID]
+    ) -> Union[BleakGATTCharacteristicBlueZDBus, None]:
+        """Get a characteristic by UUID.
+
+        Args:
+            uuid: The UUID to match.
+
+        Returns:
+            The first characteristic matching ``uuid`` or ``None`` if no
+            matching characteristic was found.
+        """
+        return self.__characteristics_by_uuid.get(str(uuid).lower())
 
     @property
     def path(self):
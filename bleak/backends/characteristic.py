@@ -75,7 +75,11 @@ class BleakGATTCharacteristic(abc.ABC):
     def get_descriptor(
         self, specifier: Union[int, str, UUID]
     ) -> Union[BleakGATTDescriptor, None]:
-        """Get a descriptor by handle (int) or UUID (str or uuid.UUID)"""
+        """Get a descriptor by handle (int) or UUID (str or uuid.UUID)
+
+        If several descriptors have the handle or UUID, the first one added is
+        returned.
+        """
         raise NotImplementedError()
 
     @abc.abstractmethod
@@ -6,6 +6,8 @@ Created on 2018-04-23 by hbldh <henrik.blidh@nedomkull.com>
 
 """
 import abc
+import asyncio
+import collections
 import uuid
 from typing import Callable, Union
 
@@ -244,3 +246,40 @@ class BaseBleakClient(abc.ABC):
 
         """
         raise NotImplementedError()
+
+
+def batched_call_soon_threadsafe(
+    loop: asyncio.AbstractEventLoop, func: Callable
+) -> Callable:
+    """Returns a function that calls ``func`` in ``loop`` from any thread.
+
+    Calls made in a burst are queued and run in one batch, instead of waking
+    the event loop up once per call. They run in the order they were made.
+    """
+    queue = collections.deque()
+    drain_scheduled = [False]
+    # Bound once rather than looked up per call.
+    enqueue = queue.append
+    dequeue = queue.popleft
+    call_soon_threadsafe = loop.call_soon_threadsafe
+
+    def drain():
+        # Cleared before draining, so a call queued after the last popleft()
+        # always schedules another drain.
+        drain_scheduled[0] = False
+        try:
+            while queue:
+                func(*dequeue())
+        finally:
+            # An error raised by one call must not strand the rest.
+            if queue and not drain_scheduled[0]:
+                drain_scheduled[0] = True
+                call_soon_threadsafe(drain)
+
+    def call(*args):
+        enqueue(args)
+        if not drain_scheduled[0]:
+            drain_scheduled[0] = True
+            call_soon_threadsafe(drain)
+
+    return call
@@ -76,7 +76,9 @@ class CentralManagerDelegate(NSObject):
 
         self.callbacks = {}
         self.disconnected_callback = None
-        self._connection_state_changed = asyncio.Event()
+        # Pending connect_() and disconnect() calls, completed by the delegate.
+        self._connect_future = None
+        self._disconnect_future = None
 
         self._did_update_state_event = threading.Event()
         self.central_manager = CBCentralManager.alloc().initWithDelegate_queue_(
@@ -144,17 +146,17 @@ class CentralManagerDelegate(NSObject):
 
     async def connect_(self, peripheral: CBPeripheral, timeout=10.0) -> bool:
         self._connection_state = CMDConnectionState.PENDING
-        self._connection_state_changed.clear()
+        future = self._connect_future = self.event_loop.create_future()
         self.central_manager.connectPeripheral_options_(peripheral, None)
 
         try:
-            await asyncio.wait_for(
-                self._connection_state_changed.wait(), timeout=timeout
-            )
+            await asyncio.wait_for(future, timeout=timeout)
         except asyncio.TimeoutError:
             logger.debug(f"Connection timed out after {timeout} seconds.")
             self.central_manager.cancelPeripheralConnection_(peripheral)
             raise
+        finally:
+            self._connect_future = None
 
         self.connected_peripheral = peripheral
 
@@ -166,10 +168,13 @@ class CentralManagerDelegate(NSObject):
             return True
 
         self._connection_state = CMDConnectionState.PENDING
+        future = self._disconnect_future = self.event_loop.create_future()
         self.central_manager.cancelPeripheralConnection_(self.connected_peripheral)
 
-        while self._connection_state == CMDConnectionState.PENDING:
-            await asyncio.sleep(0)
+        try:
+            await future
+        finally:
+            self._disconnect_future = None
 
         return self._connection_state == CMDConnectionState.DISCONNECTED
 
@@ -236,9 +241,12 @@ class CentralManagerDelegate(NSObject):
                 callback(peripheral, advertisementData, RSSI)
 
         logger.debug(
-            "Discovered device {}: {} @ RSSI: {} (kCBAdvData {}) and Central: {}".format(
-                uuid_string, device.name, RSSI, advertisementData.keys(), central
-            )
+            "Discovered device %s: %s @ RSSI: %s (kCBAdvData %s) and Central: %s",
+            uuid_string,
+            device.name,
+            RSSI,
+            advertisementData.keys(),
+            central,
         )
 
     def centralManager_didDiscoverPeripheral_advertisementData_RSSI_(
@@ -260,9 +268,8 @@ class CentralManagerDelegate(NSObject):
     @objc.python_method
     def did_connect_peripheral(self, central, peripheral):
         logger.debug(
-            "Successfully connected to device uuid {}".format(
-                peripheral.identifier().UUIDString()
-            )
+            "Successfully connected to device uuid %s",
+            peripheral.identifier().UUIDString(),
         )
         if self._connection_state != CMDConnectionState.CONNECTED:
             peripheralDelegate = PeripheralDelegate.alloc().initWithPeripheral_(
@@ -270,7 +277,7 @@ class CentralManagerDelegate(NSObject):
             )
             self.connected_peripheral_delegate = peripheralDelegate
             self._connection_state = CMDConnectionState.CONNECTED
-            self._connection_state_changed.set()
+            _complete(self._connect_future)
 
     def centralManager_didConnectPeripheral_(self, central, peripheral):
         logger.debug("centralManager_didConnectPeripheral_")
@@ -285,12 +292,11 @@ class CentralManagerDelegate(NSObject):
         self, centralManager: CBCentralManager, peripheral: CBPeripheral, error: NSError
     ):
         logger.debug(
-            "Failed to connect to device uuid {}".format(
-                peripheral.identifier().UUIDString()
-            )
+            "Failed to connect to device uuid %s",
+            peripheral.identifier().UUIDString(),
         )
         self._connection_state = CMDConnectionState.DISCONNECTED
-        self._connection_state_changed.set()
+        _complete(self._connect_future)
 
     def centralManager_didFailToConnectPeripheral_error_(
         self, centralManager: CBCentralManager, peripheral: CBPeripheral, error: NSError
@@ -311,6 +317,7 @@ class CentralManagerDelegate(NSObject):
         self.connected_peripheral_delegate = None
         self.connected_peripheral = None
         self._connection_state = CMDConnectionState.DISCONNECTED
+        _complete(self._disconnect_future)
 
         if self.disconnected_callback is not None:
             self.disconnected_callback()
@@ -327,6 +334,12 @@ class CentralManagerDelegate(NSObject):
         )
 
 
+def _complete(future: asyncio.Future):
+    # Wake up the call waiting on ``future``, if it is still waiting.
+    if future is not None and not future.done():
+        future.set_result(None)
+
+
 def string2uuid(uuid_str: str) -> CBUUID:
     """Convert a string to a uuid"""
     return CBUUID.UUIDWithString_(uuid_str)
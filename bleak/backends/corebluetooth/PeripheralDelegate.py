@@ -22,6 +22,7 @@ from Foundation import (
 )
 from CoreBluetooth import CBCharacteristicWriteWithResponse
 
+from bleak.backends.client import batched_call_soon_threadsafe
 from bleak.exc import BleakError
 
 # logging.basicConfig(level=logging.DEBUG)
@@ -30,17 +31,49 @@ logger = logging.getLogger(__name__)
 CBPeripheralDelegate = objc.protocolNamed("CBPeripheralDelegate")
 
 
-class _EventDict(dict):
-    def get_cleared(self, xUUID) -> asyncio.Event:
+class _FutureDict(dict):
+    def create(self, key) -> asyncio.Future:
         """Convenience method.
-        Returns a cleared (False) event. Creates it if doesn't exits.
+        Returns a new pending future for ``key``.
+
+        Raises:
+            BleakError: if an operation on ``key`` is still pending.
         """
-        if xUUID not in self:
-            # init as cleared (False)
-            self[xUUID] = asyncio.Event()
+        future = self.get(key)
+        if future is not None and not future.done():
+            raise BleakError(
+                "An operation on handle {} is already in progress".format(key)
+            )
+        future = asyncio.get_event_loop().create_future()
+        self[key] = future
+        return future
+
+    def join(self, key):
+        """Returns the pending future for ``key``, creating one if there is none.
+
+        Returns:
+            A ``(future, created)`` tuple. ``created`` is ``False`` if the caller
+            shares the future of an operation already in progress.
+        """
+        future = self.get(key)
+        if future is not None and not future.done():
+            return future, False
+        return self.create(key), True
+
+    def resolve(self, key, error: Exception = None) -> bool:
+        """Completes the pending future for ``key`` with ``error`` or ``None``.
+
+        Returns:
+            ``True`` if there was a pending future to complete.
+        """
+        future = self.pop(key, None)
+        if future is None or future.done():
+            return False
+        if error is None:
+            future.set_result(None)
         else:
-            self[xUUID].clear()
-        return self[xUUID]
+            future.set_exception(error)
+        return True
 
 
 class PeripheralDelegate(NSObject):
@@ -57,22 +90,44 @@ class PeripheralDelegate(NSObject):
 
         self.peripheral = peripheral
         self.peripheral.setDelegate_(self)
+        # pyobjc resolves the selector on every attribute access of the
+        # peripheral; the methods used for each GATT read and write are bound
+        # once here.
+        self._read_value_for_characteristic = peripheral.readValueForCharacteristic_
+        self._write_value_for_characteristic = (
+            peripheral.writeValue_forCharacteristic_type_
+        )
 
         self._event_loop = asyncio.get_event_loop()
+        # CoreBluetooth calls the delegate on its own dispatch queue; everything
+        # is handed over to the event loop through this bound method.
+        self._call_soon_threadsafe = self._event_loop.call_soon_threadsafe
         self._services_discovered_event = asyncio.Event()
 
-        self._service_characteristic_discovered_events = _EventDict()
-        self._characteristic_descriptor_discover_events = _EventDict()
+        self._service_characteristic_discovered_futures = _FutureDict()
+        self._characteristic_descriptor_discover_futures = _FutureDict()
 
-        self._characteristic_read_events = _EventDict()
-        self._characteristic_write_events = _EventDict()
+        self._characteristic_read_futures = _FutureDict()
+        self._characteristic_write_futures = _FutureDict()
 
-        self._descriptor_read_events = _EventDict()
-        self._descriptor_write_events = _EventDict()
+        self._descriptor_read_futures = _FutureDict()
+        self._descriptor_write_futures = _FutureDict()
 
-        self._characteristic_notify_change_events = _EventDict()
+        self._characteristic_notify_change_futures = _FutureDict()
         self._characteristic_notify_callbacks = {}
 
+        # Value updates are the one callback that comes in bursts.
+        self._did_update_value_for_characteristic = batched_call_soon_threadsafe(
+            self._event_loop, self.did_update_value_for_characteristic
+        )
+
+        # Writes without response wait on this while Core Bluetooth's transmit
+        # queue is full. The flow control API is only there since macOS 10.13.
+        self._can_send_write_without_response = getattr(
+            peripheral, "canSendWriteWithoutResponse", None
+        )
+        self._ready_to_send_write_without_response_future = None
+
         return self
 
     async def discoverServices(self, use_cached=True) -> [CBService]:
@@ -93,10 +148,12 @@ class PeripheralDelegate(NSObject):
         if service.characteristics() is not None and use_cached is True:
             return service.characteristics()
 
-        sUUID = service.UUID().UUIDString()
-        event = self._service_characteristic_discovered_events.get_cleared(sUUID)
-        self.peripheral.discoverCharacteristics_forService_(None, service)
-        await event.wait()
+        # Keyed by the service itself, since several services may share a UUID.
+        # A discovery already in progress is joined rather than repeated.
+        future, created = self._service_characteristic_discovered_futures.join(service)
+        if created:
+            self.peripheral.discoverCharacteristics_forService_(None, service)
+        await future
 
         return service.characteristics()
 
@@ -106,10 +163,13 @@ class PeripheralDelegate(NSObject):
         if characteristic.descriptors() is not None and use_cached is True:
             return characteristic.descriptors()
 
-        cUUID = characteristic.UUID().UUIDString()
-        event = self._characteristic_descriptor_discover_events.get_cleared(cUUID)
-        self.peripheral.discoverDescriptorsForCharacteristic_(characteristic)
-        await event.wait()
+        c_handle = characteristic.handle()
+        future, created = self._characteristic_descriptor_discover_futures.join(
+            c_handle
+        )
+        if created:
+            self.peripheral.discoverDescriptorsForCharacteristic_(characteristic)
+        await future
 
         return characteristic.descriptors()
 
@@ -119,11 +179,21 @@ class PeripheralDelegate(NSObject):
         if characteristic.value() is not None and use_cached is True:
             return characteristic.value()
 
-        cUUID = characteristic.UUID().UUIDString()
+        c_handle = characteristic.handle()
 
-        event = self._characteristic_read_events.get_cleared(cUUID)
-        self.peripheral.readValueForCharacteristic_(characteristic)
-        await asyncio.wait_for(event.wait(), timeout=5)
+        # Concurrent reads of the same characteristic share one request.
+        futures = self._characteristic_read_futures
+        future, created = futures.join(c_handle)
+        if created:
+            self._read_value_for_characteristic(characteristic)
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout=5)
+        except asyncio.TimeoutError:
+            # Fail every caller sharing the read, not only this one. The
+            # exception is marked as retrieved, as there may be no other caller.
+            if futures.resolve(c_handle, asyncio.TimeoutError()):
+                future.exception()
+            raise
         if characteristic.value():
             return characteristic.value()
         else:
@@ -135,11 +205,12 @@ class PeripheralDelegate(NSObject):
         if descriptor.value() is not None and use_cached is True:
             return descriptor.value()
 
-        dUUID = descriptor.UUID().UUIDString()
+        d_handle = descriptor.handle()
 
-        event = self._descriptor_read_events.get_cleared(dUUID)
-        self.peripheral.readValueForDescriptor_(descriptor)
-        await event.wait()
+        future, created = self._descriptor_read_futures.join(d_handle)
+        if created:
+            self.peripheral.readValueForDescriptor_(descriptor)
+        await future
 
         return descriptor.value()
 
@@ -148,26 +219,35 @@ class PeripheralDelegate(NSObject):
     ) -> bool:
         # TODO: Is the type hint for response correct? Should it be a NSInteger instead?
 
-        cUUID = characteristic.UUID().UUIDString()
+        if response != CBCharacteristicWriteWithResponse:
+            # Core Bluetooth drops writes without response while its queue is
+            # full, so they are only sent once it reports room for more.
+            can_send = self._can_send_write_without_response
+            while can_send is not None and not can_send():
+                future = self._ready_to_send_write_without_response_future
+                if future is None or future.done():
+                    future = self._event_loop.create_future()
+                    self._ready_to_send_write_without_response_future = future
+                await future
+            self._write_value_for_characteristic(value, characteristic, response)
+            return True
 
-        event = self._characteristic_write_events.get_cleared(cUUID)
-        self.peripheral.writeValue_forCharacteristic_type_(
-            value, characteristic, response
-        )
+        c_handle = characteristic.handle()
 
-        if response == CBCharacteristicWriteWithResponse:
-            await event.wait()
+        future = self._characteristic_write_futures.create(c_handle)
+        self._write_value_for_characteristic(value, characteristic, response)
+        await future
 
         return True
 
     async def writeDescriptor_value_(
         self, descriptor: CBDescriptor, value: NSData
     ) -> bool:
-        dUUID = descriptor.UUID().UUIDString()
+        d_handle = descriptor.handle()
 
-        event = self._descriptor_write_events.get_cleared(dUUID)
+        future = self._descriptor_write_futures.create(d_handle)
         self.peripheral.writeValue_forDescriptor_(value, descriptor)
-        await event.wait()
+        await future
 
         return True
 
@@ -180,10 +260,10 @@ class PeripheralDelegate(NSObject):
 
         self._characteristic_notify_callbacks[c_handle] = callback
 
-        event = self._characteristic_notify_change_events.get_cleared(c_handle)
+        self._characteristic_notify_change_futures.join(c_handle)
         self.peripheral.setNotifyValue_forCharacteristic_(True, characteristic)
-        # wait for peripheral_didUpdateNotificationStateForCharacteristic_error_ to set event
-        # await event.wait()
+        # wait for peripheral_didUpdateNotificationStateForCharacteristic_error_ to complete it
+        # await future
 
         return True
 
@@ -192,10 +272,10 @@ class PeripheralDelegate(NSObject):
         if c_handle not in self._characteristic_notify_callbacks:
             raise ValueError("Characteristic notification never started")
 
-        event = self._characteristic_notify_change_events.get_cleared(c_handle)
+        self._characteristic_notify_change_futures.join(c_handle)
         self.peripheral.setNotifyValue_forCharacteristic_(False, characteristic)
-        # wait for peripheral_didUpdateNotificationStateForCharacteristic_error_ to set event
-        # await event.wait()
+        # wait for peripheral_didUpdateNotificationStateForCharacteristic_error_ to complete it
+        # await future
 
         self._characteristic_notify_callbacks.pop(c_handle)
 
@@ -215,7 +295,7 @@ class PeripheralDelegate(NSObject):
         self, peripheral: CBPeripheral, error: NSError
     ) -> None:
         logger.debug("peripheral_didDiscoverServices_")
-        self._event_loop.call_soon_threadsafe(
+        self._call_soon_threadsafe(
             self.did_discover_services,
             peripheral,
             error,
@@ -226,23 +306,24 @@ class PeripheralDelegate(NSObject):
         self, peripheral: CBPeripheral, service: CBService, error: NSError
     ):
         sUUID = service.UUID().UUIDString()
+        futures = self._service_characteristic_discovered_futures
         if error is not None:
-            raise BleakError(
+            exception = BleakError(
                 "Failed to discover services for service {}: {}".format(sUUID, error)
             )
+            if not futures.resolve(service, exception):
+                raise exception
+            return
 
         logger.debug("Characteristics discovered")
-        event = self._service_characteristic_discovered_events.get(sUUID)
-        if event:
-            event.set()
-        else:
+        if not futures.resolve(service):
             logger.debug("Unexpected event didDiscoverCharacteristicsForService")
 
     def peripheral_didDiscoverCharacteristicsForService_error_(
         self, peripheral: CBPeripheral, service: CBService, error: NSError
     ):
         logger.debug("peripheral_didDiscoverCharacteristicsForService_error_")
-        self._event_loop.call_soon_threadsafe(
+        self._call_soon_threadsafe(
             self.did_discover_characteristics_for_service,
             peripheral,
             service,
@@ -254,25 +335,27 @@ class PeripheralDelegate(NSObject):
         self, peripheral: CBPeripheral, characteristic: CBCharacteristic, error: NSError
     ):
         cUUID = characteristic.UUID().UUIDString()
+        c_handle = characteristic.handle()
+        futures = self._characteristic_descriptor_discover_futures
         if error is not None:
-            raise BleakError(
+            exception = BleakError(
                 "Failed to discover descriptors for characteristic {}: {}".format(
                     cUUID, error
                 )
             )
+            if not futures.resolve(c_handle, exception):
+                raise exception
+            return
 
-        logger.debug("Descriptor discovered {}".format(cUUID))
-        event = self._characteristic_descriptor_discover_events.get(cUUID)
-        if event:
-            event.set()
-        else:
+        logger.debug("Descriptor discovered %s", cUUID)
+        if not futures.resolve(c_handle):
             logger.warning("Unexpected event didDiscoverDescriptorsForCharacteristic")
 
     def peripheral_didDiscoverDescriptorsForCharacteristic_error_(
         self, peripheral: CBPeripheral, characteristic: CBCharacteristic, error: NSError
     ):
         logger.debug("peripheral_didDiscoverDescriptorsForCharacteristic_error_")
-        self._event_loop.call_soon_threadsafe(
+        self._call_soon_threadsafe(
             self.did_discover_descriptors_for_characteristic,
             peripheral,
             characteristic,
@@ -287,35 +370,33 @@ class PeripheralDelegate(NSObject):
         value: bytes,
         error: NSError,
     ):
-        cUUID = characteristic.UUID().UUIDString()
         c_handle = characteristic.handle()
+        futures = self._characteristic_read_futures
         if error is not None:
-            raise BleakError(
+            # The UUID is only looked up through pyobjc for the error message,
+            # not for every notification.
+            cUUID = characteristic.UUID().UUIDString()
+            exception = BleakError(
                 "Failed to read characteristic {}: {}".format(cUUID, error)
             )
+            if not futures.resolve(c_handle, exception):
+                raise exception
+            return
 
         notify_callback = self._characteristic_notify_callbacks.get(c_handle)
         if notify_callback:
             notify_callback(c_handle, value)
 
         logger.debug("Read characteristic value")
-        event = self._characteristic_read_events.get(cUUID)
-        if event:
-            event.set()
-        else:
-            # only expected on read
-            pass
+        # only expected on read
+        futures.resolve(c_handle)
 
     def peripheral_didUpdateValueForCharacteristic_error_(
         self, peripheral: CBPeripheral, characteristic: CBCharacteristic, error: NSError
     ):
         logger.debug("peripheral_didUpdateValueForCharacteristic_error_")
-        self._event_loop.call_soon_threadsafe(
-            self.did_update_value_for_characteristic,
-            peripheral,
-            characteristic,
-            characteristic.value(),
-            error,
+        self._did_update_value_for_characteristic(
+            peripheral, characteristic, characteristic.value(), error
         )
 
     @objc.python_method
@@ -323,21 +404,25 @@ class PeripheralDelegate(NSObject):
         self, peripheral: CBPeripheral, descriptor: CBDescriptor, error: NSError
     ):
         dUUID = descriptor.UUID().UUIDString()
+        d_handle = descriptor.handle()
+        futures = self._descriptor_read_futures
         if error is not None:
-            raise BleakError("Failed to read descriptor {}: {}".format(dUUID, error))
+            exception = BleakError(
+                "Failed to read descriptor {}: {}".format(dUUID, error)
+            )
+            if not futures.resolve(d_handle, exception):
+                raise exception
+            return
 
         logger.debug("Read descriptor value")
-        event = self._descriptor_read_events.get(dUUID)
-        if event:
-            event.set()
-        else:
+        if not futures.resolve(d_handle):
             logger.warning("Unexpected event didUpdateValueForDescriptor")
 
     def peripheral_didUpdateValueForDescriptor_error_(
         self, peripheral: CBPeripheral, descriptor: CBDescriptor, error: NSError
     ):
         logger.debug("peripheral_didUpdateValueForDescriptor_error_")
-        self._event_loop.call_soon_threadsafe(
+        self._call_soon_threadsafe(
             self.did_update_value_for_descriptor,
             peripheral,
             descriptor,
@@ -349,24 +434,25 @@ class PeripheralDelegate(NSObject):
         self, peripheral: CBPeripheral, characteristic: CBCharacteristic, error: NSError
     ):
         cUUID = characteristic.UUID().UUIDString()
+        c_handle = characteristic.handle()
+        futures = self._characteristic_write_futures
         if error is not None:
-            raise BleakError(
+            exception = BleakError(
                 "Failed to write characteristic {}: {}".format(cUUID, error)
             )
+            if not futures.resolve(c_handle, exception):
+                raise exception
+            return
 
         logger.debug("Write Characteristic Value")
-        event = self._characteristic_write_events.get(cUUID)
-        if event:
-            event.set()
-        else:
-            # event only expected on write with response
-            pass
+        # event only expected on write with response
+        futures.resolve(c_handle)
 
     def peripheral_didWriteValueForCharacteristic_error_(
         self, peripheral: CBPeripheral, characteristic: CBCharacteristic, error: NSError
     ):
         logger.debug("peripheral_didWriteValueForCharacteristic_error_")
-        self._event_loop.call_soon_threadsafe(
+        self._call_soon_threadsafe(
             self.did_write_value_for_characteristic,
             peripheral,
             characteristic,
@@ -378,21 +464,25 @@ class PeripheralDelegate(NSObject):
         self, peripheral: CBPeripheral, descriptor: CBDescriptor, error: NSError
     ):
         dUUID = descriptor.UUID().UUIDString()
+        d_handle = descriptor.handle()
+        futures = self._descriptor_write_futures
         if error is not None:
-            raise BleakError("Failed to write descriptor {}: {}".format(dUUID, error))
+            exception = BleakError(
+                "Failed to write descriptor {}: {}".format(dUUID, error)
+            )
+            if not futures.resolve(d_handle, exception):
+                raise exception
+            return
 
         logger.debug("Write Descriptor Value")
-        event = self._descriptor_write_events.get(dUUID)
-        if event:
-            event.set()
-        else:
+        if not futures.resolve(d_handle):
             logger.warning("Unexpected event didWriteValueForDescriptor")
 
     def peripheral_didWriteValueForDescriptor_error_(
         self, peripheral: CBPeripheral, descriptor: CBDescriptor, error: NSError
     ):
         logger.debug("peripheral_didWriteValueForDescriptor_error_")
-        self._event_loop.call_soon_threadsafe(
+        self._call_soon_threadsafe(
             self.did_write_value_for_descriptor,
             peripheral,
             descriptor,
@@ -406,6 +496,8 @@ class PeripheralDelegate(NSObject):
         cUUID = characteristic.UUID().UUIDString()
         c_handle = characteristic.handle()
         if error is not None:
+            # Nothing awaits these futures yet, so the error is raised here.
+            self._characteristic_notify_change_futures.pop(c_handle, None)
             raise BleakError(
                 "Failed to update the notification status for characteristic {}: {}".format(
                     cUUID, error
@@ -413,10 +505,7 @@ class PeripheralDelegate(NSObject):
             )
         logger.debug("Character Notify Update")
 
-        event = self._characteristic_notify_change_events.get(c_handle)
-        if event:
-            event.set()
-        else:
+        if not self._characteristic_notify_change_futures.resolve(c_handle):
             logger.warning(
                 "Unexpected event didUpdateNotificationStateForCharacteristic"
             )
@@ -425,9 +514,21 @@ class PeripheralDelegate(NSObject):
         self, peripheral: CBPeripheral, characteristic: CBCharacteristic, error: NSError
     ):
         logger.debug("peripheral_didUpdateNotificationStateForCharacteristic_error_")
-        self._event_loop.call_soon_threadsafe(
+        self._call_soon_threadsafe(
             self.did_update_notification_for_characteristic,
             peripheral,
             characteristic,
             error,
         )
+
+    @objc.python_method
+    def did_become_ready_to_send_write_without_response(self, peripheral: CBPeripheral):
+        future = self._ready_to_send_write_without_response_future
+        if future is not None and not future.done():
+            future.set_result(None)
+
+    def peripheralIsReadyToSendWriteWithoutResponse_(self, peripheral: CBPeripheral):
+        logger.debug("peripheralIsReadyToSendWriteWithoutResponse_")
+        self._call_soon_threadsafe(
+            self.did_become_ready_to_send_write_without_response, peripheral
+        )
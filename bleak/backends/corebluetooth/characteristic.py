@@ -56,18 +56,33 @@ _GattCharacteristicsPropertiesEnum = {
 
 
 class BleakGATTCharacteristicCoreBluetooth(BleakGATTCharacteristic):
-    """GATT Characteristic implementation for the CoreBluetooth backend"""
+    """GATT Characteristic implementation for the CoreBluetooth backend
 
-    def __init__(self, obj: CBCharacteristic):
+    Args:
+        obj (CBCharacteristic): The characteristic to wrap.
+        service_uuid (str): The UUID of the service containing it, which
+            otherwise is read from ``obj.service()``.
+    """
+
+    def __init__(self, obj: CBCharacteristic, service_uuid: str = None):
         super().__init__(obj)
         self.__descriptors = []
-        # self.__props = obj.properties()
-        self.__props = [
-            _GattCharacteristicsPropertiesEnum[v][0]
-            for v in [2 ** n for n in range(10)]
-            if (self.obj.properties() & v)
-        ]
+        self.__descriptors_by_handle = {}
+        self.__descriptors_by_uuid = {}
+        # Visit only the set bits of the mask, reading it from the CBCharacteristic once.
+        self.__props = []
+        props = int(self.obj.properties())
+        while props:
+            bit = props & -props
+            if bit in _GattCharacteristicsPropertiesEnum:
+                self.__props.append(_GattCharacteristicsPropertiesEnum[bit][0])
+            props ^= bit
         self._uuid = cb_uuid_to_str(self.obj.UUID())
+        self.__service_uuid = (
+            service_uuid
+            if service_uuid is not None
+            else cb_uuid_to_str(self.obj.service().UUID())
+        )
 
     def __str__(self):
         return "{0}: {1}".format(self.uuid, self.description)
@@ -75,7 +90,7 @@ class BleakGATTCharacteristicCoreBluetooth(BleakGATTCharacteristic):
     @property
     def service_uuid(self) -> str:
         """The uuid of the Service containing this characteristic"""
-        return cb_uuid_to_str(self.obj.service().UUID())
+        return self.__service_uuid
 
     @property
     def handle(self) -> int:
@@ -101,15 +116,9 @@ class BleakGATTCharacteristicCoreBluetooth(BleakGATTCharacteristic):
         self, specifier
     ) -> Union[BleakGATTDescriptorCoreBluetooth, None]:
         """Get a descriptor by handle (int) or UUID (str or uuid.UUID)"""
-        try:
-            if isinstance(specifier, int):
-                return next(filter(lambda x: x.handle == specifier, self.descriptors))
-            else:
-                return next(
-                    filter(lambda x: x.uuid == str(specifier), self.descriptors)
-                )
-        except StopIteration:
-            return None
+        if isinstance(specifier, int):
+            return self.__descriptors_by_handle.get(specifier)
+        return self.__descriptors_by_uuid.get(str(specifier))
 
     def add_descriptor(self, descriptor: BleakGATTDescriptor):
         """Add a :py:class:`~BleakGATTDescriptor` to the characteristic.
@@ -117,3 +126,5 @@ class BleakGATTCharacteristicCoreBluetooth(BleakGATTCharacteristic):
         Should not be used by end user, but rather by `bleak` itself.
         """
         self.__descriptors.append(descriptor)
+        self.__descriptors_by_handle.setdefault(descriptor.handle, descriptor)
+        self.__descriptors_by_uuid.setdefault(descriptor.uuid, descriptor)
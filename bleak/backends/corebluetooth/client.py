@@ -22,7 +22,6 @@ from bleak.backends.corebluetooth.characteristic import (
 from bleak.backends.corebluetooth.descriptor import BleakGATTDescriptorCoreBluetooth
 from bleak.backends.corebluetooth.scanner import BleakScannerCoreBluetooth
 from bleak.backends.corebluetooth.service import BleakGATTServiceCoreBluetooth
-from bleak.backends.corebluetooth.utils import cb_uuid_to_str
 from bleak.backends.device import BLEDevice
 from bleak.backends.service import BleakGATTServiceCollection
 from bleak.backends.characteristic import BleakGATTCharacteristic
@@ -85,8 +84,8 @@ class BleakClientCoreBluetooth(BaseBleakClient):
         # self._device_info.manager() should return a CBCentralManager
 
         manager = self._central_manager_delegate
-        logger.debug("CentralManagerDelegate  at {}".format(manager))
-        logger.debug("Connecting to BLE device @ {}".format(self.address))
+        logger.debug("CentralManagerDelegate  at %s", manager)
+        logger.debug("Connecting to BLE device @ %s", self.address)
         await manager.connect_(self._device_info, timeout=timeout)
         manager.disconnected_callback = self._disconnected_callback_client
 
@@ -122,6 +121,28 @@ class BleakClientCoreBluetooth(BaseBleakClient):
         manager = self._central_manager_delegate
         return False if manager is None else manager.isConnected
 
+    @property
+    def mtu_size(self) -> int:
+        """The ATT MTU of the active connection.
+
+        Core Bluetooth negotiates the largest MTU supported by both sides by
+        itself, so a write without response of up to ``mtu_size - 3`` bytes is
+        sent in a single packet. Requires macOS 10.12 or newer.
+
+        Raises:
+            BleakError: If the client is not connected.
+        """
+        manager = self._central_manager_delegate
+        peripheral = None if manager is None else manager.connected_peripheral
+        if peripheral is None:
+            raise BleakError("Not connected")
+        return (
+            peripheral.maximumWriteValueLengthForType_(
+                CBCharacteristicWriteWithoutResponse
+            )
+            + 3
+        )
+
     async def pair(self, *args, **kwargs) -> bool:
         """Attempt to pair with a peripheral.
 
@@ -162,44 +183,55 @@ class BleakClientCoreBluetooth(BaseBleakClient):
             return self.services
 
         logger.debug("Retrieving services...")
-        manager = self._central_manager_delegate
-        services = await manager.connected_peripheral_delegate.discoverServices()
-
-        for service in services:
-            serviceUUID = service.UUID().UUIDString()
-            logger.debug(
-                "Retrieving characteristics for service {}".format(serviceUUID)
-            )
-            characteristics = (
-                await manager.connected_peripheral_delegate.discoverCharacteristics_(
-                    service
-                )
-            )
-
-            self.services.add_service(BleakGATTServiceCoreBluetooth(service))
+        delegate = self._central_manager_delegate.connected_peripheral_delegate
+        services = await delegate.discoverServices()
+
+        # The discovery requests for all services, and then for all
+        # characteristics, are issued at once and queued by Core Bluetooth,
+        # instead of waiting for each reply before sending the next request.
+        logger.debug("Retrieving characteristics for %d services", len(services))
+        characteristics_by_service = await asyncio.gather(
+            *(delegate.discoverCharacteristics_(service) for service in services)
+        )
 
+        bleak_services = []
+        cb_characteristics = []
+        bleak_characteristics = []
+        for service, characteristics in zip(services, characteristics_by_service):
+            bleak_service = BleakGATTServiceCoreBluetooth(service)
+            bleak_services.append(bleak_service)
             for characteristic in characteristics:
-                cUUID = characteristic.UUID().UUIDString()
-                logger.debug(
-                    "Retrieving descriptors for characteristic {}".format(cUUID)
-                )
-                descriptors = (
-                    await manager.connected_peripheral_delegate.discoverDescriptors_(
-                        characteristic
+                # UUID and handle are read through pyobjc once per characteristic
+                # here, not again for each of its descriptors.
+                cb_characteristics.append(characteristic)
+                bleak_characteristics.append(
+                    BleakGATTCharacteristicCoreBluetooth(
+                        characteristic, bleak_service.uuid
                     )
                 )
 
-                self.services.add_characteristic(
-                    BleakGATTCharacteristicCoreBluetooth(characteristic)
-                )
-                for descriptor in descriptors:
-                    self.services.add_descriptor(
-                        BleakGATTDescriptorCoreBluetooth(
-                            descriptor,
-                            cb_uuid_to_str(characteristic.UUID()),
-                            int(characteristic.handle()),
-                        )
+        logger.debug(
+            "Retrieving descriptors for %d characteristics", len(cb_characteristics)
+        )
+        descriptors_by_characteristic = await asyncio.gather(
+            *(
+                delegate.discoverDescriptors_(characteristic)
+                for characteristic in cb_characteristics
+            )
+        )
+
+        bleak_descriptors = []
+        for bleak_characteristic, descriptors in zip(
+            bleak_characteristics, descriptors_by_characteristic
+        ):
+            characteristic_handle = bleak_characteristic.handle
+            for descriptor in descriptors:
+                bleak_descriptors.append(
+                    BleakGATTDescriptorCoreBluetooth(
+                        descriptor, bleak_characteristic.uuid, characteristic_handle
                     )
+                )
+        self.services.add_all(bleak_services, bleak_characteristics, bleak_descriptors)
         logger.debug("Services resolved for %s", str(self))
         self._services_resolved = True
         self._services = services
@@ -237,7 +269,7 @@ class BleakClientCoreBluetooth(BaseBleakClient):
             characteristic.obj, use_cached=use_cached
         )
         value = bytearray(output)
-        logger.debug("Read Characteristic {0} : {1}".format(characteristic.uuid, value))
+        logger.debug("Read Characteristic %s : %s", characteristic.uuid, value)
         return value
 
     async def read_gatt_descriptor(
@@ -268,7 +300,7 @@ class BleakClientCoreBluetooth(BaseBleakClient):
             value = bytearray(output.encode("utf-8"))
         else:  # _NSInlineData
             value = bytearray(output)  # value.getBytes_length_(None, len(value))
-        logger.debug("Read Descriptor {0} : {1}".format(handle, value))
+        logger.debug("Read Descriptor %s : %s", handle, value)
         return value
 
     async def write_gatt_char(
@@ -307,9 +339,7 @@ class BleakClientCoreBluetooth(BaseBleakClient):
             )
         )
         if success:
-            logger.debug(
-                "Write Characteristic {0} : {1}".format(characteristic.uuid, data)
-            )
+            logger.debug("Write Characteristic %s : %s", characteristic.uuid, data)
         else:
             raise BleakError(
                 "Could not write value {0} to characteristic {1}: {2}".format(
@@ -336,7 +366,7 @@ class BleakClientCoreBluetooth(BaseBleakClient):
             descriptor.obj, value
         )
         if success:
-            logger.debug("Write Descriptor {0} : {1}".format(handle, data))
+            logger.debug("Write Descriptor %s : %s", handle, data)
         else:
             raise BleakError(
                 "Could not write value {0} to descriptor {1}: {2}".format(
@@ -20,6 +20,8 @@ class BleakGATTDescriptorCoreBluetooth(BleakGATTDescriptor):
         self.obj = obj
         self.__characteristic_uuid = characteristic_uuid
         self.__characteristic_handle = characteristic_handle
+        self.__uuid = cb_uuid_to_str(obj.UUID())
+        self.__handle = int(obj.handle())
 
     def __str__(self):
         return "{0}: (Handle: {1})".format(self.uuid, self.handle)
@@ -37,9 +39,9 @@ class BleakGATTDescriptorCoreBluetooth(BleakGATTDescriptor):
     @property
     def uuid(self) -> str:
         """UUID for this descriptor"""
-        return cb_uuid_to_str(self.obj.UUID())
+        return self.__uuid
 
     @property
     def handle(self) -> int:
         """Integer handle for this descriptor"""
-        return int(self.obj.handle())
+        return self.__handle
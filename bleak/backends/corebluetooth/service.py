@@ -1,5 +1,6 @@
 from bleak.backends.corebluetooth.utils import cb_uuid_to_str
-from typing import List
+from typing import List, Union
+from uuid import UUID
 
 from Foundation import CBService
 
@@ -15,11 +16,13 @@ class BleakGATTServiceCoreBluetooth(BleakGATTService):
     def __init__(self, obj: CBService):
         super().__init__(obj)
         self.__characteristics = []
+        self.__characteristics_by_uuid = {}
+        self.__uuid = cb_uuid_to_str(obj.UUID())
 
     @property
     def uuid(self) -> str:
         """UUID for this service."""
-        return cb_uuid_to_str(self.obj.UUID())
+        return self.__uuid
 
     @property
     def characteristics(self) -> List[BleakGATTCharacteristicCoreBluetooth]:
@@ -32,3 +35,18 @@ class BleakGATTServiceCoreBluetooth(BleakGATTService):
         Should not be used by end user, but rather by `bleak` itself.
         """
         self.__characteristics.append(characteristic)
+        self.__characteristics_by_uuid.setdefault(characteristic.uuid, characteristic)
+
+    def get_characteristic(
+        self, uuid: Union[str, UUID]
+    ) -> Union[BleakGATTCharacteristicCoreBluetooth, None]:
+        """Get a characteristic by UUID.
+
+        Args:
+            uuid: The UUID to match.
+
+        Returns:
+            The first characteristic matching ``uuid`` or ``None`` if no
+            matching characteristic was found.
+        """
+        return self.__characteristics_by_uuid.get(str(uuid).lower())
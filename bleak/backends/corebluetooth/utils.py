@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from Foundation import NSData, CBUUID
 
 
@@ -13,7 +15,13 @@ def cb_uuid_to_str(_uuid: CBUUID) -> str:
     Returns:
         The UUID as a lower case Python string (``xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxx``)
     """
-    _uuid = _uuid.UUIDString()
+    return _uuid_string_to_str(str(_uuid.UUIDString()))
+
+
+@lru_cache(maxsize=128)
+def _uuid_string_to_str(_uuid: str) -> str:
+    # The same few UUIDs recur in every advertisement and GATT object of a
+    # device, so the normalized strings are cached.
     if len(_uuid) == 4:
         return "0000{0}-0000-1000-8000-00805f9b34fb".format(_uuid.lower())
     # TODO: Evaluate if this is a necessary method...
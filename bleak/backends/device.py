@@ -14,15 +14,17 @@ class BLEDevice(object):
     a `discover` call.
 
     - When using Windows backend, `details` attribute is a
-      ``Windows.Devices.Bluetooth.Advertisement.BluetoothLEAdvertisement`` object, unless
-      it is created with the Windows.Devices.Enumeration discovery method, then is is a
-      ``Windows.Devices.Enumeration.DeviceInformation``.
+      ``bleak.backends.dotnet.scanner.AdvertisementDetailsDotNet`` object holding the
+      ``BluetoothAddress``, ``AdvertisementType`` and ``RawSignalStrengthInDBm`` of the
+      received advertisement.
     - When using Linux backend, ``details`` attribute is a
       dict with keys ``path`` which has the string path to the DBus device object and ``props``
       which houses the properties dictionary of the D-Bus Device.
     - When using macOS backend, ``details`` attribute will be a CBPeripheral object.
     """
 
+    __slots__ = ("address", "name", "details", "rssi", "metadata")
+
     def __init__(self, address, name, details=None, rssi=0, **kwargs):
         #: The Bluetooth address of the device on this machine.
         self.address = address
@@ -39,20 +39,35 @@ _GattCharacteristicsPropertiesEnum = {
     ),
 }
 
+# (bit, name) pairs for decomposing a property bitmask, built once at import.
+_PROP_BITS = tuple(
+    (1 << n, _GattCharacteristicsPropertiesEnum[1 << n][0]) for n in range(10)
+)
+
 
 class BleakGATTCharacteristicDotNet(BleakGATTCharacteristic):
-    """GATT Characteristic implementation for the .NET backend"""
+    """GATT Characteristic implementation for the .NET backend
+
+    Args:
+        obj (GattCharacteristic): The characteristic to wrap.
+        service_uuid (str): The UUID of the service containing it. Looked up
+            through ``obj.Service`` if not given.
+    """
 
-    def __init__(self, obj: GattCharacteristic):
+    def __init__(self, obj: GattCharacteristic, service_uuid: str = None):
         super().__init__(obj)
         self.__descriptors = [
             # BleakGATTDescriptorDotNet(d, self.uuid) for d in obj.GetAllDescriptors()
         ]
-        self.__props = [
-            _GattCharacteristicsPropertiesEnum[v][0]
-            for v in [2 ** n for n in range(10)]
-            if (self.obj.CharacteristicProperties & v)
-        ]
+        self.__descriptors_by_handle = {}
+        self.__descriptors_by_uuid = {}
+        self.__service_uuid = (
+            service_uuid if service_uuid is not None else obj.Service.Uuid.ToString()
+        )
+        self.__handle = int(obj.AttributeHandle)
+        self.__uuid = obj.Uuid.ToString()
+        mask = int(self.obj.CharacteristicProperties)
+        self.__props = [name for bit, name in _PROP_BITS if mask & bit]
 
     def __str__(self):
         return "[{0}] {1}: {2}".format(self.handle, self.uuid, self.description)
@@ -60,17 +75,17 @@ class BleakGATTCharacteristicDotNet(BleakGATTCharacteristic):
     @property
     def service_uuid(self) -> str:
         """The uuid of the Service containing this characteristic"""
-        return self.obj.Service.Uuid.ToString()
+        return self.__service_uuid
 
     @property
     def handle(self) -> int:
         """The handle of this characteristic"""
-        return int(self.obj.AttributeHandle)
+        return self.__handle
 
     @property
     def uuid(self) -> str:
         """The uuid of this characteristic"""
-        return self.obj.Uuid.ToString()
+        return self.__uuid
 
     @property
     def properties(self) -> List:
@@ -86,15 +101,9 @@ class BleakGATTCharacteristicDotNet(BleakGATTCharacteristic):
         self, specifier: Union[int, str, UUID]
     ) -> Union[BleakGATTDescriptorDotNet, None]:
         """Get a descriptor by handle (int) or UUID (str or uuid.UUID)"""
-        try:
-            if isinstance(specifier, int):
-                return next(filter(lambda x: x.handle == specifier, self.descriptors))
-            else:
-                return next(
-                    filter(lambda x: x.uuid == str(specifier), self.descriptors)
-                )
-        except StopIteration:
-            return None
+        if isinstance(specifier, int):
+            return self.__descriptors_by_handle.get(specifier)
+        return self.__descriptors_by_uuid.get(str(specifier))
 
     def add_descriptor(self, descriptor: BleakGATTDescriptor):
         """Add a :py:class:`~BleakGATTDescriptor` to the characteristic.
@@ -102,3 +111,5 @@ class BleakGATTCharacteristicDotNet(BleakGATTCharacteristic):
         Should not be used by end user, but rather by `bleak` itself.
         """
         self.__descriptors.append(descriptor)
+        self.__descriptors_by_handle.setdefault(descriptor.handle, descriptor)
+        self.__descriptors_by_uuid.setdefault(descriptor.uuid, descriptor)
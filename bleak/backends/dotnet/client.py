@@ -7,17 +7,19 @@ Created on 2017-12-05 by hbldh <henrik.blidh@nedomkull.com>
 
 import logging
 import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import uuid
-from functools import wraps
 from typing import Callable, Any, Union
 
 from bleak.backends.device import BLEDevice
 from bleak.backends.dotnet.scanner import BleakScannerDotNet
 from bleak.exc import BleakError, BleakDotNetTaskError, CONTROLLER_ERROR_CODES
-from bleak.backends.client import BaseBleakClient
+from bleak.backends.client import BaseBleakClient, batched_call_soon_threadsafe
+from bleak.utils import mac_str_2_int
 from bleak.backends.dotnet.utils import (
-    BleakDataReader,
-    BleakDataWriter,
+    create_buffer,
+    read_bytearray,
     wrap_IAsyncOperation,
 )
 
@@ -67,22 +69,76 @@ from Windows.Devices.Bluetooth.GenericAttributeProfile import (
 
 logger = logging.getLogger(__name__)
 
-_communication_statues = {
-    getattr(GattCommunicationStatus, k): k
-    for k in ["Success", "Unreachable", "ProtocolError", "AccessDenied"]
-}
+# GattCommunicationStatus names, indexed by their values 0 to 3.
+_communication_statues = ("Success", "Unreachable", "ProtocolError", "AccessDenied")
+_SUCCESS = GattCommunicationStatus.Success
+_PROTOCOL_ERROR = GattCommunicationStatus.ProtocolError
+_CONNECTED = BluetoothConnectionStatus.Connected
+_DISCONNECTED = BluetoothConnectionStatus.Disconnected
+_CACHED = BluetoothCacheMode.Cached
+_UNCACHED = BluetoothCacheMode.Uncached
+_WRITE_WITH_RESPONSE = GattWriteOption.WriteWithResponse
+_WRITE_WITHOUT_RESPONSE = GattWriteOption.WriteWithoutResponse
 
-_pairing_statuses = {
-    getattr(DevicePairingResultStatus, v): v
-    for v in dir(DevicePairingResultStatus)
-    if "_" not in v and isinstance(getattr(DevicePairingResultStatus, v), int)
-}
+# Generic types used on every GATT read, write and notification, bound once.
+_GattReadOperation = IAsyncOperation[GattReadResult]
+_GattWriteOperation = IAsyncOperation[GattWriteResult]
+_GattStatusOperation = IAsyncOperation[GattCommunicationStatus]
+_ValueChangedHandler = TypedEventHandler[GattCharacteristic, GattValueChangedEventArgs]
 
-_unpairing_statuses = {
-    getattr(DeviceUnpairingResultStatus, v): v
-    for v in dir(DeviceUnpairingResultStatus)
-    if "_" not in v and isinstance(getattr(DeviceUnpairingResultStatus, v), int)
-}
+
+def _communication_status_name(status) -> str:
+    i = int(status)
+    return _communication_statues[i] if 0 <= i < len(_communication_statues) else ""
+
+
+def _raise_on_error(result, msg: str, *args, exc=BleakError) -> None:
+    """Raise an error describing a failed GATT operation result.
+
+    Nothing is formatted unless ``result`` holds an error status.
+
+    Args:
+        result: The WinRT ``Gatt*Result`` to check.
+        msg (str): ``%``-style description of the failed operation.
+        *args: Arguments to ``msg``.
+        exc: The exception type to raise. Defaults to :py:class:`BleakError`.
+
+    """
+    status = result.Status
+    if status == _SUCCESS:
+        return
+
+    if status == _PROTOCOL_ERROR:
+        raise exc(
+            "{0}: {1} (Error: 0x{2:02X}: {3})".format(
+                msg % args,
+                _communication_status_name(status),
+                result.ProtocolError,
+                CONTROLLER_ERROR_CODES.get(result.ProtocolError, "Unknown"),
+            )
+        )
+    raise exc("{0}: {1}".format(msg % args, _communication_status_name(status)))
+
+
+@functools.lru_cache(maxsize=None)
+def _enum_names(enum_type) -> tuple:
+    # Names of the members of a .NET enum with small non-negative values,
+    # indexed by value. Unused values map to ``None``. Built on first use
+    # rather than at import, since it reflects over every enum member.
+    members = {
+        getattr(enum_type, v): v
+        for v in dir(enum_type)
+        if "_" not in v and isinstance(getattr(enum_type, v), int)
+    }
+    names = [None] * (max(members) + 1)
+    for value, name in members.items():
+        names[value] = name
+    return tuple(names)
+
+
+def _enum_name(enum_type, value):
+    names = _enum_names(enum_type)
+    return names[value] if 0 <= value < len(names) else None
 
 
 class BleakClientDotNet(BaseBleakClient):
@@ -95,7 +151,7 @@ class BleakClientDotNet(BaseBleakClient):
         address_or_ble_device (`BLEDevice` or str): The Bluetooth address of the BLE peripheral to connect to or the `BLEDevice` object representing it.
 
     Keyword Args:
-            timeout (float): Timeout for required ``BleakScanner.find_device_by_address`` call. Defaults to 10.0.
+            timeout (float): Timeout for the ``BleakScanner.find_device_by_address`` call, if one is needed. Defaults to 10.0.
 
     """
 
@@ -106,19 +162,30 @@ class BleakClientDotNet(BaseBleakClient):
         if isinstance(address_or_ble_device, BLEDevice):
             self._device_info = address_or_ble_device.details.BluetoothAddress
         else:
-            self._device_info = None
+            # Windows can usually open a device straight from its address, so
+            # the scan in connect() is only a fallback.
+            try:
+                self._device_info = mac_str_2_int(address_or_ble_device)
+            except ValueError:
+                self._device_info = None
         self._requester = None
+        # Tracked from ConnectionStatusChanged events by connect().
+        self._connected = False
+        self._loop: asyncio.AbstractEventLoop = None
         self._connect_events: list[asyncio.Event] = []
         self._disconnect_events: list[asyncio.Event] = []
         self._connection_status_changed_token: EventRegistrationToken = None
         self._session: GattSession = None
+        self._use_cached_services = True
+        self._services_discovery_future: asyncio.Future = None
+        self._discover_descriptors = True
+        # Runs the callbacks of subscriptions made with ``thread_safe=True``.
+        self._notify_executor: ThreadPoolExecutor = None
 
-        self._address_type = (
-            kwargs["address_type"]
-            if "address_type" in kwargs
-            and kwargs["address_type"] in ("public", "random")
-            else None
-        )
+        self._address_type = {
+            "public": BluetoothAddressType.Public,
+            "random": BluetoothAddressType.Random,
+        }.get(kwargs.get("address_type"))
 
     def __str__(self):
         return "BleakClientDotNet ({0})".format(self.address)
@@ -129,44 +196,45 @@ class BleakClientDotNet(BaseBleakClient):
         """Connect to the specified GATT server.
 
         Keyword Args:
-            timeout (float): Timeout for required ``BleakScanner.find_device_by_address`` call. Defaults to 10.0.
+            timeout (float): Timeout for the ``BleakScanner.find_device_by_address`` call, if one is needed. Defaults to 10.0.
+            use_cached (bool): If set to `True`, Windows is allowed to resolve the GATT services
+                from its own cache of a previous connection. Defaults to `True`.
+            discover_services (bool): If set to `False`, the GATT services are not resolved
+                until they are first needed, which makes ``connect`` return sooner.
+                Defaults to `True`.
+            discover_descriptors (bool): If set to `False`, the descriptors of the
+                characteristics are not resolved, saving one request per characteristic.
+                Notifications do not need them. Defaults to `True`.
 
         Returns:
             Boolean representing connection status.
 
         """
+        timeout = kwargs.get("timeout", self._timeout)
+        # WinRT events are raised on other threads and are handed over to the
+        # loop that connected.
+        self._loop = asyncio.get_event_loop()
+
         # Try to find the desired device.
         if self._device_info is None:
-            timeout = kwargs.get("timeout", self._timeout)
-            device = await BleakScannerDotNet.find_device_by_address(
-                self.address, timeout=timeout
-            )
+            await self._find_device_info(timeout)
 
-            if device:
-                self._device_info = device.details.BluetoothAddress
-            else:
+        logger.debug("Connecting to BLE device @ %s", self.address)
+
+        self._requester = await self._get_requester()
+        if self._requester is None:
+            # Windows has not seen the device yet, so scan for it and retry.
+            await self._find_device_info(timeout)
+            self._requester = await self._get_requester()
+            if self._requester is None:
                 raise BleakError(
                     "Device with address {0} was not found.".format(self.address)
                 )
 
-        logger.debug("Connecting to BLE device @ {0}".format(self.address))
-
-        args = [UInt64(self._device_info)]
-        if self._address_type is not None:
-            args.append(
-                BluetoothAddressType.Public
-                if self._address_type == "public"
-                else BluetoothAddressType.Random
-            )
-        self._requester = await wrap_IAsyncOperation(
-            IAsyncOperation[BluetoothLEDevice](
-                BluetoothLEDevice.FromBluetoothAddressAsync(*args)
-            ),
-            return_type=BluetoothLEDevice,
-        )
-
         # Called on disconnect event or on failure to connect.
         def handle_disconnect():
+            self._connected = False
+
             if self._connection_status_changed_token:
                 self._requester.remove_ConnectionStatusChanged(
                     self._connection_status_changed_token
@@ -184,11 +252,12 @@ class BleakClientDotNet(BaseBleakClient):
         def handle_connection_status_changed(
             connection_status: BluetoothConnectionStatus,
         ):
-            if connection_status == BluetoothConnectionStatus.Connected:
+            if connection_status == _CONNECTED:
+                self._connected = True
                 for e in self._connect_events:
                     e.set()
 
-            elif connection_status == BluetoothConnectionStatus.Disconnected:
+            elif connection_status == _DISCONNECTED:
                 if self._disconnected_callback:
                     self._disconnected_callback(self)
 
@@ -197,7 +266,7 @@ class BleakClientDotNet(BaseBleakClient):
 
                 handle_disconnect()
 
-        loop = asyncio.get_event_loop()
+        loop = self._loop
 
         def _ConnectionStatusChanged_Handler(sender, args):
             logger.debug(
@@ -228,17 +297,63 @@ class BleakClientDotNet(BaseBleakClient):
             # This keeps the device connected until we dispose the session or
             # until we set MaintainConnection = False.
             self._session.MaintainConnection = True
-            await asyncio.wait_for(event.wait(), timeout=10)
+            # No ConnectionStatusChanged event is raised if Windows already
+            # holds a connection to the device, so only wait when there is
+            # one to come.
+            if self._requester.ConnectionStatus != _CONNECTED:
+                await asyncio.wait_for(event.wait(), timeout=10)
         except BaseException:
             handle_disconnect()
             raise
         finally:
             self._connect_events.remove(event)
 
-        await self.get_services()
+        self._connected = True
+        self._use_cached_services = kwargs.get("use_cached", True)
+        self._discover_descriptors = kwargs.get("discover_descriptors", True)
+        if kwargs.get("discover_services", True):
+            await self.get_services(
+                use_cached=self._use_cached_services,
+                discover_descriptors=self._discover_descriptors,
+            )
 
         return True
 
+    async def _resolve_char(
+        self, char_specifier: Union[BleakGATTCharacteristic, int, str, uuid.UUID]
+    ) -> BleakGATTCharacteristic:
+        if isinstance(char_specifier, BleakGATTCharacteristic):
+            return char_specifier
+
+        await self._ensure_services()
+        characteristic = self.services.get_characteristic(char_specifier)
+        if not characteristic:
+            raise BleakError("Characteristic {0} was not found!".format(char_specifier))
+        return characteristic
+
+    async def _find_device_info(self, timeout: float) -> None:
+        device = await BleakScannerDotNet.find_device_by_address(
+            self.address, timeout=timeout
+        )
+
+        if device:
+            self._device_info = device.details.BluetoothAddress
+        else:
+            raise BleakError(
+                "Device with address {0} was not found.".format(self.address)
+            )
+
+    async def _get_requester(self):
+        args = [UInt64(self._device_info)]
+        if self._address_type is not None:
+            args.append(self._address_type)
+        return await wrap_IAsyncOperation(
+            IAsyncOperation[BluetoothLEDevice](
+                BluetoothLEDevice.FromBluetoothAddressAsync(*args)
+            ),
+            return_type=BluetoothLEDevice,
+        )
+
     async def disconnect(self) -> bool:
         """Disconnect from the specified GATT server.
 
@@ -250,11 +365,19 @@ class BleakClientDotNet(BaseBleakClient):
 
         """
         logger.debug("Disconnecting from BLE device...")
+        # A discovery still running would publish services of this connection
+        # after they have been disposed below.
+        if self._services_discovery_future is not None:
+            self._services_discovery_future.cancel()
+            self._services_discovery_future = None
+
         # Remove notifications.
-        for characteristic in self.services.characteristics.values():
-            token = self._notification_callbacks.pop(characteristic.handle, None)
-            if token:
-                characteristic.obj.remove_ValueChanged(token)
+        for handle, token in self._notification_callbacks.items():
+            self.services.characteristics[handle].obj.remove_ValueChanged(token)
+        self._notification_callbacks.clear()
+        if self._notify_executor is not None:
+            self._notify_executor.shutdown(wait=False)
+            self._notify_executor = None
 
         # Dispose all service components that we have requested and created.
         for service in self.services:
@@ -286,12 +409,7 @@ class BleakClientDotNet(BaseBleakClient):
             Boolean representing connection status.
 
         """
-        if self._requester:
-            return (
-                self._requester.ConnectionStatus == BluetoothConnectionStatus.Connected
-            )
-        else:
-            return False
+        return self._connected
 
     async def pair(self, protection_level=None, **kwargs) -> bool:
         """Attempts to pair with the device.
@@ -348,7 +466,7 @@ class BleakClientDotNet(BaseBleakClient):
                 raise BleakError(
                     "Could not pair with device: {0}: {1}".format(
                         pairing_result.Status,
-                        _pairing_statuses.get(pairing_result.Status),
+                        _enum_name(DevicePairingResultStatus, pairing_result.Status),
                     )
                 )
             else:
@@ -377,13 +495,15 @@ class BleakClientDotNet(BaseBleakClient):
             )
 
             if unpairing_result.Status not in (
-                DevicePairingResultStatus.Paired,
-                DevicePairingResultStatus.AlreadyPaired,
+                DeviceUnpairingResultStatus.Unpaired,
+                DeviceUnpairingResultStatus.AlreadyUnpaired,
             ):
                 raise BleakError(
                     "Could not unpair with device: {0}: {1}".format(
                         unpairing_result.Status,
-                        _unpairing_statuses.get(unpairing_result.Status),
+                        _enum_name(
+                            DeviceUnpairingResultStatus, unpairing_result.Status
+                        ),
                     )
                 )
             else:
@@ -393,9 +513,22 @@ class BleakClientDotNet(BaseBleakClient):
 
     # GATT services methods
 
-    async def get_services(self) -> BleakGATTServiceCollection:
+    async def get_services(
+        self, use_cached=True, discover_descriptors=True, **kwargs
+    ) -> BleakGATTServiceCollection:
         """Get all services registered for this GATT server.
 
+        Args:
+            use_cached (bool): If `True`, Windows is allowed to return the services,
+                characteristics and descriptors from its own GATT cache for this
+                device, which skips service discovery on reconnect. `False` forces
+                discovery over the air. Defaults to `True`.
+            discover_descriptors (bool): If `False`, the descriptors of the
+                characteristics are not resolved. Defaults to `True`.
+
+        If a discovery is already in progress, this call waits for it and its
+        ``use_cached`` and ``discover_descriptors`` arguments are ignored.
+
         Returns:
            A :py:class:`bleak.backends.service.BleakGATTServiceCollection` with this device's services tree.
 
@@ -403,115 +536,162 @@ class BleakClientDotNet(BaseBleakClient):
         # Return the Service Collection.
         if self._services_resolved:
             return self.services
-        else:
-            logger.debug("Get Services...")
-            services_result = await wrap_IAsyncOperation(
-                IAsyncOperation[GattDeviceServicesResult](
-                    self._requester.GetGattServicesAsync()
-                ),
-                return_type=GattDeviceServicesResult,
+
+        # Concurrent callers share the discovery already in progress.
+        future = self._services_discovery_future
+        if future is None:
+            future = self._services_discovery_future = asyncio.ensure_future(
+                self._discover_services(use_cached, discover_descriptors)
             )
+            future.add_done_callback(self._services_discovery_done)
+        # Shielded, so a cancelled caller does not cancel the discovery for
+        # the others.
+        return await asyncio.shield(future)
+
+    def _services_discovery_done(self, future: asyncio.Future) -> None:
+        if self._services_discovery_future is future:
+            self._services_discovery_future = None
+        # Retrieved here in case every caller was cancelled; callers still
+        # waiting get the exception all the same.
+        if not future.cancelled():
+            future.exception()
+
+    async def _discover_services(
+        self, use_cached: bool, discover_descriptors: bool
+    ) -> BleakGATTServiceCollection:
+        logger.debug("Get Services...")
+        requester = self._requester
+        cache_mode = _CACHED if use_cached else _UNCACHED
+        services_result = await wrap_IAsyncOperation(
+            IAsyncOperation[GattDeviceServicesResult](
+                requester.GetGattServicesAsync(cache_mode)
+            ),
+            return_type=GattDeviceServicesResult,
+        )
 
-            if services_result.Status != GattCommunicationStatus.Success:
-                if services_result.Status == GattCommunicationStatus.ProtocolError:
-                    raise BleakDotNetTaskError(
-                        "Could not get GATT services: {0} (Error: 0x{1:02X}: {2})".format(
-                            _communication_statues.get(services_result.Status, ""),
-                            services_result.ProtocolError,
-                            CONTROLLER_ERROR_CODES.get(
-                                services_result.ProtocolError, "Unknown"
-                            ),
-                        )
-                    )
-                else:
-                    raise BleakDotNetTaskError(
-                        "Could not get GATT services: {0}".format(
-                            _communication_statues.get(services_result.Status, "")
-                        )
-                    )
+        _raise_on_error(
+            services_result,
+            "Could not get GATT services",
+            exc=BleakDotNetTaskError,
+        )
 
-            for service in services_result.Services:
-                characteristics_result = await wrap_IAsyncOperation(
+        # The per-service and per-characteristic requests are independent,
+        # so they are issued together and checked once they have all
+        # completed, letting Windows pipeline the ATT round-trips.
+        services = list(services_result.Services)
+        characteristics_results = await asyncio.gather(
+            *[
+                wrap_IAsyncOperation(
                     IAsyncOperation[GattCharacteristicsResult](
-                        service.GetCharacteristicsAsync()
+                        service.GetCharacteristicsAsync(cache_mode)
                     ),
                     return_type=GattCharacteristicsResult,
                 )
-                self.services.add_service(BleakGATTServiceDotNet(service))
-                if characteristics_result.Status != GattCommunicationStatus.Success:
-                    if (
-                        characteristics_result.Status
-                        == GattCommunicationStatus.ProtocolError
-                    ):
-                        raise BleakDotNetTaskError(
-                            "Could not get GATT characteristics for {0}: {1} (Error: 0x{2:02X}: {3})".format(
-                                service,
-                                _communication_statues.get(
-                                    characteristics_result.Status, ""
-                                ),
-                                characteristics_result.ProtocolError,
-                                CONTROLLER_ERROR_CODES.get(
-                                    characteristics_result.ProtocolError, "Unknown"
-                                ),
-                            )
-                        )
-                    else:
-                        raise BleakDotNetTaskError(
-                            "Could not get GATT characteristics for {0}: {1}".format(
-                                service,
-                                _communication_statues.get(
-                                    characteristics_result.Status, ""
+                for service in services
+            ],
+            return_exceptions=True,
+        )
+        characteristics_lists = []
+        for service, characteristics_result in zip(services, characteristics_results):
+            if isinstance(characteristics_result, Exception):
+                raise characteristics_result
+            _raise_on_error(
+                characteristics_result,
+                "Could not get GATT characteristics for %s",
+                service,
+                exc=BleakDotNetTaskError,
+            )
+            characteristics_lists.append(list(characteristics_result.Characteristics))
+
+        # The descriptor requests of all services are put in flight before
+        # any wrapping is done, so that the Python bookkeeping below
+        # overlaps with the remaining round-trips.
+        if discover_descriptors:
+            descriptors_futures = [
+                asyncio.ensure_future(
+                    asyncio.gather(
+                        *[
+                            wrap_IAsyncOperation(
+                                IAsyncOperation[GattDescriptorsResult](
+                                    characteristic.GetDescriptorsAsync(cache_mode)
                                 ),
+                                return_type=GattDescriptorsResult,
                             )
-                        )
-                for characteristic in characteristics_result.Characteristics:
-                    descriptors_result = await wrap_IAsyncOperation(
-                        IAsyncOperation[GattDescriptorsResult](
-                            characteristic.GetDescriptorsAsync()
-                        ),
-                        return_type=GattDescriptorsResult,
+                            for characteristic in characteristics
+                        ],
+                        return_exceptions=True,
                     )
-                    self.services.add_characteristic(
-                        BleakGATTCharacteristicDotNet(characteristic)
+                )
+                for characteristics in characteristics_lists
+            ]
+        else:
+            descriptors_futures = [None] * len(services)
+
+        wrapped_services = []
+        all_characteristics = []
+        all_descriptors = []
+        try:
+            for service, characteristics, descriptors_future in zip(
+                services, characteristics_lists, descriptors_futures
+            ):
+                wrapped_service = BleakGATTServiceDotNet(service)
+                wrapped_services.append(wrapped_service)
+                wrapped_characteristics = [
+                    BleakGATTCharacteristicDotNet(characteristic, wrapped_service.uuid)
+                    for characteristic in characteristics
+                ]
+                all_characteristics.extend(wrapped_characteristics)
+
+                if descriptors_future is None:
+                    continue
+
+                descriptors_results = await descriptors_future
+                for characteristic, wrapped, descriptors_result in zip(
+                    characteristics, wrapped_characteristics, descriptors_results
+                ):
+                    if isinstance(descriptors_result, Exception):
+                        raise descriptors_result
+                    _raise_on_error(
+                        descriptors_result,
+                        "Could not get GATT descriptors for %s",
+                        characteristic,
+                        exc=BleakDotNetTaskError,
                     )
-                    if descriptors_result.Status != GattCommunicationStatus.Success:
-                        if (
-                            characteristics_result.Status
-                            == GattCommunicationStatus.ProtocolError
-                        ):
-                            raise BleakDotNetTaskError(
-                                "Could not get GATT descriptors for {0}: {1} (Error: 0x{2:02X}: {3})".format(
-                                    service,
-                                    _communication_statues.get(
-                                        descriptors_result.Status, ""
-                                    ),
-                                    descriptors_result.ProtocolError,
-                                    CONTROLLER_ERROR_CODES.get(
-                                        descriptors_result.ProtocolError, "Unknown"
-                                    ),
-                                )
-                            )
-                        else:
-                            raise BleakDotNetTaskError(
-                                "Could not get GATT descriptors for {0}: {1}".format(
-                                    characteristic,
-                                    _communication_statues.get(
-                                        descriptors_result.Status, ""
-                                    ),
-                                )
-                            )
-                    for descriptor in list(descriptors_result.Descriptors):
-                        self.services.add_descriptor(
+                    for descriptor in descriptors_result.Descriptors:
+                        all_descriptors.append(
                             BleakGATTDescriptorDotNet(
-                                descriptor,
-                                characteristic.Uuid.ToString(),
-                                int(characteristic.AttributeHandle),
+                                descriptor, wrapped.uuid, wrapped.handle
                             )
                         )
-
-            logger.info("Services resolved for %s", str(self))
-            self._services_resolved = True
-            return self.services
+        finally:
+            for descriptors_future in descriptors_futures:
+                if descriptors_future is not None:
+                    descriptors_future.cancel()
+
+        # The device may have disconnected, and even reconnected, while the
+        # requests were in flight; these services then belong to a connection
+        # that is gone.
+        if self._requester is not requester:
+            for service in wrapped_services:
+                service.obj.Dispose()
+            raise BleakError("Disconnected during service discovery")
+
+        services_collection = BleakGATTServiceCollection()
+        services_collection.add_all(
+            wrapped_services, all_characteristics, all_descriptors
+        )
+        self.services = services_collection
+        logger.info("Services resolved for %s", str(self))
+        self._services_resolved = True
+        return self.services
+
+    async def _ensure_services(self):
+        # Resolves the services on first use if connect() was told not to.
+        if not self._services_resolved and self._requester is not None:
+            await self.get_services(
+                use_cached=self._use_cached_services,
+                discover_descriptors=self._discover_descriptors,
+            )
 
     # I/O methods
 
@@ -534,48 +714,22 @@ class BleakClientDotNet(BaseBleakClient):
             (bytearray) The read data.
 
         """
-        if not isinstance(char_specifier, BleakGATTCharacteristic):
-            characteristic = self.services.get_characteristic(char_specifier)
-        else:
-            characteristic = char_specifier
-        if not characteristic:
-            raise BleakError("Characteristic {0} was not found!".format(char_specifier))
+        characteristic = await self._resolve_char(char_specifier)
 
         read_result = await wrap_IAsyncOperation(
-            IAsyncOperation[GattReadResult](
-                characteristic.obj.ReadValueAsync(
-                    BluetoothCacheMode.Cached
-                    if use_cached
-                    else BluetoothCacheMode.Uncached
-                )
+            _GattReadOperation(
+                characteristic.obj.ReadValueAsync(_CACHED if use_cached else _UNCACHED)
             ),
             return_type=GattReadResult,
         )
-        if read_result.Status == GattCommunicationStatus.Success:
-            with BleakDataReader(read_result.Value) as reader:
-                value = bytearray(reader.read())
-            logger.debug(
-                "Read Characteristic {0} : {1}".format(characteristic.uuid, value)
-            )
-        else:
-            if read_result.Status == GattCommunicationStatus.ProtocolError:
-                raise BleakDotNetTaskError(
-                    "Could not get GATT characteristics for {0}: {1} (Error: 0x{2:02X}: {3})".format(
-                        characteristic.uuid,
-                        _communication_statues.get(read_result.Status, ""),
-                        read_result.ProtocolError,
-                        CONTROLLER_ERROR_CODES.get(
-                            read_result.ProtocolError, "Unknown"
-                        ),
-                    )
-                )
-            else:
-                raise BleakError(
-                    "Could not read characteristic value for {0}: {1}".format(
-                        characteristic.uuid,
-                        _communication_statues.get(read_result.Status, ""),
-                    )
-                )
+        _raise_on_error(
+            read_result,
+            "Could not read characteristic value for %s",
+            characteristic.uuid,
+            exc=BleakDotNetTaskError,
+        )
+        value = read_bytearray(read_result.Value)
+        logger.debug("Read Characteristic %s : %s", characteristic.uuid, value)
         return value
 
     async def read_gatt_descriptor(
@@ -592,44 +746,25 @@ class BleakClientDotNet(BaseBleakClient):
             (bytearray) The read data.
 
         """
+        await self._ensure_services()
         descriptor = self.services.get_descriptor(handle)
         if not descriptor:
             raise BleakError("Descriptor with handle {0} was not found!".format(handle))
 
         read_result = await wrap_IAsyncOperation(
-            IAsyncOperation[GattReadResult](
-                descriptor.obj.ReadValueAsync(
-                    BluetoothCacheMode.Cached
-                    if use_cached
-                    else BluetoothCacheMode.Uncached
-                )
+            _GattReadOperation(
+                descriptor.obj.ReadValueAsync(_CACHED if use_cached else _UNCACHED)
             ),
             return_type=GattReadResult,
         )
-        if read_result.Status == GattCommunicationStatus.Success:
-            with BleakDataReader(read_result.Value) as reader:
-                value = bytearray(reader.read())
-            logger.debug("Read Descriptor {0} : {1}".format(handle, value))
-        else:
-            if read_result.Status == GattCommunicationStatus.ProtocolError:
-                raise BleakDotNetTaskError(
-                    "Could not get GATT characteristics for {0}: {1} (Error: 0x{2:02X}: {3})".format(
-                        descriptor.uuid,
-                        _communication_statues.get(read_result.Status, ""),
-                        read_result.ProtocolError,
-                        CONTROLLER_ERROR_CODES.get(
-                            read_result.ProtocolError, "Unknown"
-                        ),
-                    )
-                )
-            else:
-                raise BleakError(
-                    "Could not read Descriptor value for {0}: {1}".format(
-                        descriptor.uuid,
-                        _communication_statues.get(read_result.Status, ""),
-                    )
-                )
-
+        _raise_on_error(
+            read_result,
+            "Could not read Descriptor value for %s",
+            descriptor.uuid,
+            exc=BleakDotNetTaskError,
+        )
+        value = read_bytearray(read_result.Value)
+        logger.debug("Read Descriptor %s : %s", handle, value)
         return value
 
     async def write_gatt_char(
@@ -648,53 +783,25 @@ class BleakClientDotNet(BaseBleakClient):
             response (bool): If write-with-response operation should be done. Defaults to `False`.
 
         """
-        if not isinstance(char_specifier, BleakGATTCharacteristic):
-            characteristic = self.services.get_characteristic(char_specifier)
-        else:
-            characteristic = char_specifier
-        if not characteristic:
-            raise BleakError("Characteristic {} was not found!".format(char_specifier))
-
-        with BleakDataWriter(data) as writer:
-            response = (
-                GattWriteOption.WriteWithResponse
-                if response
-                else GattWriteOption.WriteWithoutResponse
-            )
-            write_result = await wrap_IAsyncOperation(
-                IAsyncOperation[GattWriteResult](
-                    characteristic.obj.WriteValueWithResultAsync(
-                        writer.detach_buffer(), response
-                    )
-                ),
-                return_type=GattWriteResult,
-            )
+        characteristic = await self._resolve_char(char_specifier)
 
-        if write_result.Status == GattCommunicationStatus.Success:
-            logger.debug(
-                "Write Characteristic {0} : {1}".format(characteristic.uuid, data)
-            )
-        else:
-            if write_result.Status == GattCommunicationStatus.ProtocolError:
-                raise BleakError(
-                    "Could not write value {0} to characteristic {1}: {2} (Error: 0x{3:02X}: {4})".format(
-                        data,
-                        characteristic.uuid,
-                        _communication_statues.get(write_result.Status, ""),
-                        write_result.ProtocolError,
-                        CONTROLLER_ERROR_CODES.get(
-                            write_result.ProtocolError, "Unknown"
-                        ),
-                    )
-                )
-            else:
-                raise BleakError(
-                    "Could not write value {0} to characteristic {1}: {2}".format(
-                        data,
-                        characteristic.uuid,
-                        _communication_statues.get(write_result.Status, ""),
-                    )
+        response = _WRITE_WITH_RESPONSE if response else _WRITE_WITHOUT_RESPONSE
+        write_result = await wrap_IAsyncOperation(
+            _GattWriteOperation(
+                characteristic.obj.WriteValueWithResultAsync(
+                    create_buffer(data), response
                 )
+            ),
+            return_type=GattWriteResult,
+        )
+
+        _raise_on_error(
+            write_result,
+            "Could not write value %s to characteristic %s",
+            data,
+            characteristic.uuid,
+        )
+        logger.debug("Write Characteristic %s : %s", characteristic.uuid, data)
 
     async def write_gatt_descriptor(self, handle: int, data: bytearray) -> None:
         """Perform a write operation on the specified GATT descriptor.
@@ -704,41 +811,25 @@ class BleakClientDotNet(BaseBleakClient):
             data (bytes or bytearray): The data to send.
 
         """
+        await self._ensure_services()
         descriptor = self.services.get_descriptor(handle)
         if not descriptor:
             raise BleakError("Descriptor with handle {0} was not found!".format(handle))
 
-        with BleakDataWriter(data) as writer:
-            write_result = await wrap_IAsyncOperation(
-                IAsyncOperation[GattWriteResult](
-                    descriptor.obj.WriteValueWithResultAsync(writer.detach_buffer())
-                ),
-                return_type=GattWriteResult,
-            )
+        write_result = await wrap_IAsyncOperation(
+            _GattWriteOperation(
+                descriptor.obj.WriteValueWithResultAsync(create_buffer(data))
+            ),
+            return_type=GattWriteResult,
+        )
 
-        if write_result.Status == GattCommunicationStatus.Success:
-            logger.debug("Write Descriptor {0} : {1}".format(handle, data))
-        else:
-            if write_result.Status == GattCommunicationStatus.ProtocolError:
-                raise BleakError(
-                    "Could not write value {0} to characteristic {1}: {2} (Error: 0x{3:02X}: {4})".format(
-                        data,
-                        descriptor.uuid,
-                        _communication_statues.get(write_result.Status, ""),
-                        write_result.ProtocolError,
-                        CONTROLLER_ERROR_CODES.get(
-                            write_result.ProtocolError, "Unknown"
-                        ),
-                    )
-                )
-            else:
-                raise BleakError(
-                    "Could not write value {0} to descriptor {1}: {2}".format(
-                        data,
-                        descriptor.uuid,
-                        _communication_statues.get(write_result.Status, ""),
-                    )
-                )
+        _raise_on_error(
+            write_result,
+            "Could not write value %s to descriptor %s",
+            data,
+            descriptor.uuid,
+        )
+        logger.debug("Write Descriptor %s : %s", handle, data)
 
     async def start_notify(
         self,
@@ -763,13 +854,15 @@ class BleakClientDotNet(BaseBleakClient):
                 UUID or directly by the BleakGATTCharacteristic object representing it.
             callback (function): The function to be called on notification.
 
+        Keyword Args:
+            thread_safe (bool): If set to `True`, ``callback`` is called on a worker
+                thread instead of in the event loop, so a slow callback does not
+                hold up the loop. Notifications of all such subscriptions of this
+                client share one thread and are delivered in the order received.
+                Defaults to `False`.
+
         """
-        if not isinstance(char_specifier, BleakGATTCharacteristic):
-            characteristic = self.services.get_characteristic(char_specifier)
-        else:
-            characteristic = char_specifier
-        if not characteristic:
-            raise BleakError("Characteristic {0} not found!".format(char_specifier))
+        characteristic = await self._resolve_char(char_specifier)
 
         if characteristic.handle in self._notification_callbacks:
             await self.stop_notify(characteristic)
@@ -788,16 +881,23 @@ class BleakClientDotNet(BaseBleakClient):
         else:
             cccd = getattr(GattClientCharacteristicConfigurationDescriptorValue, "None")
 
+        if kwargs.get("thread_safe", False):
+            if self._notify_executor is None:
+                self._notify_executor = ThreadPoolExecutor(max_workers=1)
+            notification_parser = _executor_notification_wrapper(
+                callback, self._notify_executor
+            )
+        else:
+            notification_parser = _notification_wrapper(callback, self._loop)
+
         self._notification_callbacks[
             characteristic.handle
         ] = characteristic_obj.add_ValueChanged(
-            TypedEventHandler[GattCharacteristic, GattValueChangedEventArgs](
-                _notification_wrapper(callback, asyncio.get_event_loop())
-            )
+            _ValueChangedHandler(notification_parser)
         )
 
         status = await wrap_IAsyncOperation(
-            IAsyncOperation[GattCommunicationStatus](
+            _GattStatusOperation(
                 characteristic_obj.WriteClientCharacteristicConfigurationDescriptorAsync(
                     cccd
                 )
@@ -805,7 +905,7 @@ class BleakClientDotNet(BaseBleakClient):
             return_type=GattCommunicationStatus,
         )
 
-        if status != GattCommunicationStatus.Success:
+        if status != _SUCCESS:
             # This usually happens when a device reports that it support indicate,
             # but it actually doesn't.
             characteristic_obj.remove_ValueChanged(
@@ -814,7 +914,7 @@ class BleakClientDotNet(BaseBleakClient):
             # TODO: Find out how to get the ProtocolError code that describes a potential GattCommunicationStatus.ProtocolError result.
             raise BleakError(
                 "Could not start notify on {0}: {1}".format(
-                    characteristic.uuid, _communication_statues.get(status, "")
+                    characteristic.uuid, _communication_status_name(status)
                 )
             )
 
@@ -829,15 +929,10 @@ class BleakClientDotNet(BaseBleakClient):
                 directly by the BleakGATTCharacteristic object representing it.
 
         """
-        if not isinstance(char_specifier, BleakGATTCharacteristic):
-            characteristic = self.services.get_characteristic(char_specifier)
-        else:
-            characteristic = char_specifier
-        if not characteristic:
-            raise BleakError("Characteristic {} not found!".format(char_specifier))
+        characteristic = await self._resolve_char(char_specifier)
 
         status = await wrap_IAsyncOperation(
-            IAsyncOperation[GattCommunicationStatus](
+            _GattStatusOperation(
                 characteristic.obj.WriteClientCharacteristicConfigurationDescriptorAsync(
                     getattr(
                         GattClientCharacteristicConfigurationDescriptorValue, "None"
@@ -847,10 +942,10 @@ class BleakClientDotNet(BaseBleakClient):
             return_type=GattCommunicationStatus,
         )
 
-        if status != GattCommunicationStatus.Success:
+        if status != _SUCCESS:
             raise BleakError(
                 "Could not stop notify on {0}: {1}".format(
-                    characteristic.uuid, _communication_statues.get(status, "")
+                    characteristic.uuid, _communication_status_name(status)
                 )
             )
 
@@ -860,15 +955,23 @@ class BleakClientDotNet(BaseBleakClient):
 
 
 def _notification_wrapper(func: Callable, loop: asyncio.AbstractEventLoop):
-    @wraps(func)
+    # WinRT raises ValueChanged on its own threads.
+    call = batched_call_soon_threadsafe(loop, func)
+
     def dotnet_notification_parser(sender: Any, args: Any):
         # Return only the UUID string representation as sender.
         # Also do a conversion from System.Bytes[] to bytearray.
-        with BleakDataReader(args.CharacteristicValue) as reader:
-            output = reader.read()
+        call(sender.AttributeHandle, read_bytearray(args.CharacteristicValue))
 
-        return loop.call_soon_threadsafe(
-            func, sender.AttributeHandle, bytearray(output)
-        )
+    return dotnet_notification_parser
+
+
+def _executor_notification_wrapper(func: Callable, executor: ThreadPoolExecutor):
+    # Notifications are handed straight to the executor, bypassing the event
+    # loop. With a single worker they are processed in the order received.
+    submit = executor.submit
+
+    def dotnet_notification_parser(sender: Any, args: Any):
+        submit(func, sender.AttributeHandle, read_bytearray(args.CharacteristicValue))
 
     return dotnet_notification_parser
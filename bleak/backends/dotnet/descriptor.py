@@ -17,6 +17,8 @@ class BleakGATTDescriptorDotNet(BleakGATTDescriptor):
         self.obj = obj
         self.__characteristic_uuid = characteristic_uuid
         self.__characteristic_handle = characteristic_handle
+        self.__uuid = obj.Uuid.ToString()
+        self.__handle = int(obj.AttributeHandle)
 
     def __str__(self):
         return "{0}: (Handle: {1})".format(self.uuid, self.handle)
@@ -34,9 +36,9 @@ class BleakGATTDescriptorDotNet(BleakGATTDescriptor):
     @property
     def uuid(self) -> str:
         """UUID for this descriptor"""
-        return self.obj.Uuid.ToString()
+        return self.__uuid
 
     @property
     def handle(self) -> int:
         """Integer handle for this descriptor"""
-        return self.obj.AttributeHandle
+        return self.__handle
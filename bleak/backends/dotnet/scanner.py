@@ -1,11 +1,12 @@
 import logging
 import asyncio
+import collections
 import pathlib
 from typing import List
 from uuid import UUID
 
 from bleak.backends.device import BLEDevice
-from bleak.backends.dotnet.utils import BleakDataReader
+from bleak.backends.dotnet.utils import read_buffer
 from bleak.backends.scanner import BaseBleakScanner, AdvertisementData
 
 # Import of BleakBridge to enable loading of winrt bindings
@@ -23,9 +24,26 @@ from Windows.Foundation import TypedEventHandler
 logger = logging.getLogger(__name__)
 _here = pathlib.Path(__file__).parent
 
+# Seconds between deduplication passes over received advertisements while scanning.
+_DRAIN_INTERVAL = 0.05
 
-def _format_bdaddr(a):
-    return ":".join("{:02X}".format(x) for x in a.to_bytes(6, byteorder="big"))
+# Default for the number of devices remembered during a scan.
+_MAX_DEVICES = 4096
+
+_SCAN_RESPONSE = BluetoothLEAdvertisementType.ScanResponse
+_SCAN_ACTIVE = BluetoothLEScanningMode.Active
+_SCAN_PASSIVE = BluetoothLEScanningMode.Passive
+
+# Upper case two-digit hex strings for each byte value.
+_HEX = tuple(f"{i:02X}" for i in range(256))
+
+
+def _format_bdaddr(a, _hex=_HEX):
+    # The table is bound as a default argument, a local lookup in the body.
+    return (
+        f"{_hex[(a >> 40) & 0xFF]}:{_hex[(a >> 32) & 0xFF]}:{_hex[(a >> 24) & 0xFF]}:"
+        f"{_hex[(a >> 16) & 0xFF]}:{_hex[(a >> 8) & 0xFF]}:{_hex[a & 0xFF]}"
+    )
 
 
 def _format_event_args(e):
@@ -37,6 +55,54 @@ def _format_event_args(e):
         return e.BluetoothAddress
 
 
+class AdvertisementDetailsDotNet:
+    """The fields of a ``BluetoothLEAdvertisementReceivedEventArgs`` kept as
+    :py:attr:`BLEDevice.details` after scanning.
+
+    Plain Python copies are stored instead of the .NET event args, so that
+    discovered devices do not keep the CLR object graph alive. Attribute names
+    match the .NET properties they were read from.
+    """
+
+    __slots__ = ("BluetoothAddress", "AdvertisementType", "RawSignalStrengthInDBm")
+
+    def __init__(self, event_args: BluetoothLEAdvertisementReceivedEventArgs):
+        self.BluetoothAddress = int(event_args.BluetoothAddress)
+        self.AdvertisementType = int(event_args.AdvertisementType)
+        self.RawSignalStrengthInDBm = int(event_args.RawSignalStrengthInDBm)
+
+    def __repr__(self):
+        return "AdvertisementDetailsDotNet(BluetoothAddress={0}, AdvertisementType={1}, RawSignalStrengthInDBm={2})".format(
+            self.BluetoothAddress, self.AdvertisementType, self.RawSignalStrengthInDBm
+        )
+
+
+def _post_event(loop: asyncio.AbstractEventLoop, handler, *args) -> None:
+    # Runs on a WinRT thread. Events raised around stop() may arrive after the
+    # loop of the scan has been closed, e.g. with repeated asyncio.run() calls.
+    if not loop.is_closed():
+        loop.call_soon_threadsafe(handler, *args)
+
+
+class _WatcherSession:
+    """An advertisement watcher together with its event handler registrations.
+
+    A new session is made for each scan, so that events still arriving from the
+    watcher of a stopped scan can be told apart from those of the current one.
+    """
+
+    __slots__ = ("watcher", "received_token", "stopped_token")
+
+    def __init__(self, watcher: BluetoothLEAdvertisementWatcher):
+        self.watcher = watcher
+        self.received_token = None
+        self.stopped_token = None
+
+    def remove_handlers(self):
+        self.watcher.remove_Received(self.received_token)
+        self.watcher.remove_Stopped(self.stopped_token)
+
+
 class BleakScannerDotNet(BaseBleakScanner):
     """The native Windows Bleak BLE Scanner.
 
@@ -55,42 +121,41 @@ class BleakScannerDotNet(BaseBleakScanner):
           BluetoothLEAdvertisementFilter object used for configuration of Bluetooth LE advertisement
           filtering that uses payload section-based filtering.
 
+        max_devices (int): The number of devices remembered while scanning. When more are
+          seen, the least recently seen device is forgotten. Defaults to 4096.
+
     """
 
     def __init__(self, **kwargs):
         super(BleakScannerDotNet, self).__init__(**kwargs)
 
-        self.watcher = None
-        self._devices = {}
-        self._scan_responses = {}
-
-        self._received_token = None
-        self._stopped_token = None
+        self._session = None
+        # Received advertisements, deduplicated into the dicts below on demand.
+        self._advertisements = collections.deque()
+        self._devices = collections.OrderedDict()
+        # Local names from scan responses, keyed by Bluetooth address.
+        self._scan_responses = collections.OrderedDict()
+        self._max_devices = kwargs.get("max_devices", _MAX_DEVICES)
+        self._drain_handle = None
 
         if "scanning_mode" in kwargs and kwargs["scanning_mode"].lower() == "passive":
-            self._scanning_mode = BluetoothLEScanningMode.Passive
+            self._scanning_mode = _SCAN_PASSIVE
         else:
-            self._scanning_mode = BluetoothLEScanningMode.Active
+            self._scanning_mode = _SCAN_ACTIVE
 
         self._signal_strength_filter = kwargs.get("SignalStrengthFilter", None)
         self._advertisement_filter = kwargs.get("AdvertisementFilter", None)
 
     def _received_handler(
         self,
+        session: _WatcherSession,
         sender: BluetoothLEAdvertisementWatcher,
         event_args: BluetoothLEAdvertisementReceivedEventArgs,
     ):
-        if sender == self.watcher:
-            logger.debug("Received {0}.".format(_format_event_args(event_args)))
-            if (
-                event_args.AdvertisementType
-                == BluetoothLEAdvertisementType.ScanResponse
-            ):
-                if event_args.BluetoothAddress not in self._scan_responses:
-                    self._scan_responses[event_args.BluetoothAddress] = event_args
-            else:
-                if event_args.BluetoothAddress not in self._devices:
-                    self._devices[event_args.BluetoothAddress] = event_args
+        if session is self._session:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Received %s.", _format_event_args(event_args))
+            self._advertisements.append(event_args)
 
         if self._callback is None:
             return
@@ -99,30 +164,28 @@ class BleakScannerDotNet(BaseBleakScanner):
         device = self.parse_eventargs(event_args)
 
         # Decode service data
+        advertisement = event_args.Advertisement
         service_data = {}
         # 0x16 is service data with 16-bit UUID
-        for section in event_args.Advertisement.GetSectionsByType(0x16):
-            with BleakDataReader(section.Data) as reader:
-                data = reader.read()
-                service_data[
-                    f"0000{data[1]:02x}{data[0]:02x}-0000-1000-8000-00805f9b34fb"
-                ] = data[2:]
+        for section in advertisement.GetSectionsByType(0x16):
+            data = read_buffer(section.Data)
+            service_data[
+                f"0000{data[1]:02x}{data[0]:02x}-0000-1000-8000-00805f9b34fb"
+            ] = data[2:]
         # 0x20 is service data with 32-bit UUID
-        for section in event_args.Advertisement.GetSectionsByType(0x20):
-            with BleakDataReader(section.Data) as reader:
-                data = reader.read()
-                service_data[
-                    f"{data[3]:02x}{data[2]:02x}{data[1]:02x}{data[0]:02x}-0000-1000-8000-00805f9b34fb"
-                ] = data[4:]
+        for section in advertisement.GetSectionsByType(0x20):
+            data = read_buffer(section.Data)
+            service_data[
+                f"{data[3]:02x}{data[2]:02x}{data[1]:02x}{data[0]:02x}-0000-1000-8000-00805f9b34fb"
+            ] = data[4:]
         # 0x21 is service data with 128-bit UUID
-        for section in event_args.Advertisement.GetSectionsByType(0x21):
-            with BleakDataReader(section.Data) as reader:
-                data = reader.read()
-                service_data[str(UUID(bytes=data[15::-1]))] = data[16:]
+        for section in advertisement.GetSectionsByType(0x21):
+            data = read_buffer(section.Data)
+            service_data[str(UUID(bytes=data[15::-1]))] = data[16:]
 
         # Use the BLEDevice to populate all the fields for the advertisement data to return
         advertisement_data = AdvertisementData(
-            local_name=event_args.Advertisement.LocalName,
+            local_name=advertisement.LocalName,
             manufacturer_data=device.metadata["manufacturer_data"],
             service_data=service_data,
             service_uuids=device.metadata["uuids"],
@@ -131,59 +194,114 @@ class BleakScannerDotNet(BaseBleakScanner):
 
         self._callback(device, advertisement_data)
 
+    def _drain_advertisements(self):
+        """Move queued advertisements into the per-address device dicts.
+
+        The first advertisement and scan response seen for each address is kept.
+        Beyond ``max_devices`` addresses, the least recently seen are dropped,
+        together with their scan response.
+        """
+        advertisements = self._advertisements
+        devices = self._devices
+        scan_responses = self._scan_responses
+        max_devices = self._max_devices
+        while advertisements:
+            event_args = advertisements.popleft()
+            address = event_args.BluetoothAddress
+            if event_args.AdvertisementType == _SCAN_RESPONSE:
+                if address in scan_responses:
+                    scan_responses.move_to_end(address)
+                    continue
+                # Only the local name of a scan response is ever used.
+                scan_responses[address] = event_args.Advertisement.LocalName
+                if len(scan_responses) > max_devices:
+                    scan_responses.popitem(last=False)
+            else:
+                if address in devices:
+                    devices.move_to_end(address)
+                    # A scan response is only sent once in a while, but is
+                    # used as long as its device is.
+                    if address in scan_responses:
+                        scan_responses.move_to_end(address)
+                    continue
+                devices[address] = event_args
+                if len(devices) > max_devices:
+                    scan_responses.pop(devices.popitem(last=False)[0], None)
+
+    def _periodic_drain(self, loop: asyncio.AbstractEventLoop):
+        self._drain_advertisements()
+        self._drain_handle = loop.call_later(
+            _DRAIN_INTERVAL, self._periodic_drain, loop
+        )
+
     def _stopped_handler(
         self,
+        session: _WatcherSession,
         sender: BluetoothLEAdvertisementWatcher,
         e: BluetoothLEAdvertisementWatcherStoppedEventArgs,
     ):
-        if sender == self.watcher:
+        if session is self._session:
+            self._drain_advertisements()
             logger.debug(
-                "{0} devices found. Watcher status: {1}.".format(
-                    len(self._devices), self.watcher.Status
-                )
+                "%d devices found. Watcher status: %s.",
+                len(self._devices),
+                session.watcher.Status,
             )
 
     async def start(self):
-        self.watcher = BluetoothLEAdvertisementWatcher()
-        self.watcher.ScanningMode = self._scanning_mode
+        watcher = BluetoothLEAdvertisementWatcher()
+        watcher.ScanningMode = self._scanning_mode
+        session = _WatcherSession(watcher)
 
         event_loop = asyncio.get_event_loop()
 
-        self._received_token = self.watcher.add_Received(
+        session.received_token = watcher.add_Received(
             TypedEventHandler[
                 BluetoothLEAdvertisementWatcher,
                 BluetoothLEAdvertisementReceivedEventArgs,
             ](
-                lambda s, e: event_loop.call_soon_threadsafe(
-                    self._received_handler, s, e
+                lambda s, e: _post_event(
+                    event_loop, self._received_handler, session, s, e
                 )
             )
         )
-        self._stopped_token = self.watcher.add_Stopped(
+        session.stopped_token = watcher.add_Stopped(
             TypedEventHandler[
                 BluetoothLEAdvertisementWatcher,
                 BluetoothLEAdvertisementWatcherStoppedEventArgs,
-            ](lambda s, e: event_loop.call_soon_threadsafe(self._stopped_handler, s, e))
+            ](
+                lambda s, e: _post_event(
+                    event_loop, self._stopped_handler, session, s, e
+                )
+            )
         )
 
         if self._signal_strength_filter is not None:
-            self.watcher.SignalStrengthFilter = self._signal_strength_filter
+            watcher.SignalStrengthFilter = self._signal_strength_filter
         if self._advertisement_filter is not None:
-            self.watcher.AdvertisementFilter = self._advertisement_filter
+            watcher.AdvertisementFilter = self._advertisement_filter
 
-        self.watcher.Start()
+        # Only a fully set up session is made current.
+        self._session = session
+        watcher.Start()
+        self._drain_handle = event_loop.call_later(
+            _DRAIN_INTERVAL, self._periodic_drain, event_loop
+        )
 
     async def stop(self):
-        self.watcher.Stop()
+        session = self._session
+        self._session = None
+        session.watcher.Stop()
 
-        if self._received_token:
-            self.watcher.remove_Received(self._received_token)
-            self._received_token = None
-        if self._stopped_token:
-            self.watcher.remove_Stopped(self._stopped_token)
-            self._stopped_token = None
+        if self._drain_handle:
+            self._drain_handle.cancel()
+            self._drain_handle = None
+        self._drain_advertisements()
 
-        self.watcher = None
+        # Events from the stopped watcher are ignored by the handlers from here
+        # on, so detaching them can happen off the event loop. It is still
+        # awaited, so that the handlers are gone once stop() returns.
+        await asyncio.get_event_loop().run_in_executor(None, session.remove_handlers)
 
     async def set_scanning_filter(self, **kwargs):
         """Set a scanning filter for the BleakScanner.
@@ -205,38 +323,41 @@ class BleakScannerDotNet(BaseBleakScanner):
             self._advertisement_filter = kwargs["AdvertisementFilter"]
 
     async def get_discovered_devices(self) -> List[BLEDevice]:
+        self._drain_advertisements()
+        scan_responses = self._scan_responses
         found = []
-        for event_args in list(self._devices.values()):
+        # The dicts are only changed on the event loop, never during this loop.
+        for address, event_args in self._devices.items():
             new_device = self.parse_eventargs(event_args)
-            if (
-                not new_device.name
-                and event_args.BluetoothAddress in self._scan_responses
-            ):
-                new_device.name = self._scan_responses[
-                    event_args.BluetoothAddress
-                ].Advertisement.LocalName
+            if new_device.name == "Unknown":
+                new_device.name = scan_responses.get(address) or "Unknown"
             found.append(new_device)
 
         return found
 
     @staticmethod
     def parse_eventargs(event_args):
-        bdaddr = _format_bdaddr(event_args.BluetoothAddress)
-        uuids = []
-        for u in event_args.Advertisement.ServiceUuids:
-            uuids.append(u.ToString())
-        data = {}
-        for m in event_args.Advertisement.ManufacturerData:
-            with BleakDataReader(m.Data) as reader:
-                data[m.CompanyId] = reader.read()
-        local_name = event_args.Advertisement.LocalName
-        rssi = event_args.RawSignalStrengthInDBm
+        details = AdvertisementDetailsDotNet(event_args)
+        bdaddr = _format_bdaddr(details.BluetoothAddress)
+        advertisement = event_args.Advertisement
         return BLEDevice(
-            bdaddr, local_name, event_args, rssi, uuids=uuids, manufacturer_data=data
+            bdaddr,
+            advertisement.LocalName,
+            details,
+            details.RawSignalStrengthInDBm,
+            uuids=[u.ToString() for u in advertisement.ServiceUuids],
+            manufacturer_data={
+                m.CompanyId: read_buffer(m.Data) for m in advertisement.ManufacturerData
+            },
         )
 
     # Windows specific
 
+    @property
+    def watcher(self) -> BluetoothLEAdvertisementWatcher:
+        """The advertisement watcher of the current scan, or ``None``."""
+        return self._session.watcher if self._session else None
+
     @property
     def status(self) -> int:
         """Get status of the Watcher.
@@ -259,4 +380,4 @@ class BleakScannerDotNet(BaseBleakScanner):
             The watcher stop command was issued.
 
         """
-        return self.watcher.Status if self.watcher else None
+        return self._session.watcher.Status if self._session else None
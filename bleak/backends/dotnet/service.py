@@ -1,4 +1,5 @@
-from typing import List
+from typing import List, Union
+from uuid import UUID
 
 from bleak.backends.service import BleakGATTService
 from bleak.backends.dotnet.characteristic import BleakGATTCharacteristicDotNet
@@ -17,11 +18,13 @@ class BleakGATTServiceDotNet(BleakGATTService):
         self.__characteristics = [
             # BleakGATTCharacteristicDotNet(c) for c in obj.GetAllCharacteristics()
         ]
+        self.__characteristics_by_uuid = {}
+        self.__uuid = obj.Uuid.ToString()
 
     @property
     def uuid(self) -> str:
         """UUID for this service."""
-        return self.obj.Uuid.ToString()
+        return self.__uuid
 
     @property
     def characteristics(self) -> List[BleakGATTCharacteristicDotNet]:
@@ -34,3 +37,18 @@ class BleakGATTServiceDotNet(BleakGATTService):
         Should not be used by end user, but rather by `bleak` itself.
         """
         self.__characteristics.append(characteristic)
+        self.__characteristics_by_uuid.setdefault(characteristic.uuid, characteristic)
+
+    def get_characteristic(
+        self, uuid: Union[str, UUID]
+    ) -> Union[BleakGATTCharacteristicDotNet, None]:
+        """Get a characteristic by UUID.
+
+        Args:
+            uuid: The UUID to match.
+
+        Returns:
+            The first characteristic matching ``uuid`` or ``None`` if no
+            matching characteristic was found.
+        """
+        return self.__characteristics_by_uuid.get(str(uuid).lower())
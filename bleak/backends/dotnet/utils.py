@@ -6,6 +6,8 @@ Created on 2017-12-05 by hbldh <henrik.blidh@nedomkull.com>
 """
 
 import asyncio
+import ctypes
+import functools
 
 from bleak.exc import BleakDotNetTaskError
 
@@ -22,11 +24,26 @@ from Windows.Foundation import (
     AsyncStatus,
 )
 from System import Array, Byte
+from System.Runtime.InteropServices import GCHandle, GCHandleType
+from Windows.Security.Cryptography import CryptographicBuffer
 from Windows.Storage.Streams import DataReader, DataWriter, IBuffer
 
 
+def _deliver_task(future: asyncio.Future, task):
+    # Runs on the event loop thread once the .NET Task has finished.
+    if future.done():
+        return
+    # TODO: Handle IsCancelled.
+    if task.IsFaulted:
+        # Exception occurred. Wrap it in BleakDotNetTaskError
+        # to make it catchable.
+        future.set_exception(BleakDotNetTaskError(task.Exception.ToString()))
+    else:
+        future.set_result(task.Result)
+
+
 async def wrap_Task(task):
-    """Enables await on .NET Task using asyncio.Event and a lambda callback.
+    """Enables await on .NET Task using an asyncio.Future and a lambda callback.
 
     Args:
         task (System.Threading.Tasks.Task): .NET async task object
@@ -37,22 +54,40 @@ async def wrap_Task(task):
 
     """
     loop = asyncio.get_event_loop()
-    done = asyncio.Event()
-    # Register Action<Task> callback that triggers the above asyncio.Event.
-    task.ContinueWith(Action[Task](lambda x: loop.call_soon_threadsafe(done.set)))
-    # Wait for callback.
-    await done.wait()
-    # TODO: Handle IsCancelled.
-    if task.IsFaulted:
+    future = loop.create_future()
+    # Register Action<Task> callback that completes the above asyncio.Future.
+    task.ContinueWith(
+        Action[Task](lambda x: loop.call_soon_threadsafe(_deliver_task, future, task))
+    )
+    return await future
+
+
+def _deliver_async_operation(future: asyncio.Future, op: IAsyncOperation):
+    # Runs on the event loop thread once the IAsyncOperation has finished.
+    if future.done():
+        return
+    status = op.Status
+    if status == AsyncStatus.Completed:
+        future.set_result(op.GetResults())
+    elif status == AsyncStatus.Error:
         # Exception occurred. Wrap it in BleakDotNetTaskError
         # to make it catchable.
-        raise BleakDotNetTaskError(task.Exception.ToString())
+        future.set_exception(BleakDotNetTaskError(op.ErrorCode.ToString()))
+    else:
+        # TODO: Handle IsCancelled.
+        future.set_exception(
+            BleakDotNetTaskError("IAsyncOperation Status: {0}".format(status))
+        )
 
-    return task.Result
+
+@functools.lru_cache(maxsize=None)
+def _completed_handler_type(return_type):
+    # Binding the generic handler type goes through pythonnet reflection.
+    return AsyncOperationCompletedHandler[return_type]
 
 
 async def wrap_IAsyncOperation(op: IAsyncOperation, return_type):
-    """Enables await on .NET Task using asyncio.Event and a lambda callback.
+    """Enables await on .NET Task using an asyncio.Future and a lambda callback.
 
     Args:
         op (Windows.Foundation.IAsyncOperation[TResult]): .NET async operation object to await.
@@ -63,23 +98,89 @@ async def wrap_IAsyncOperation(op: IAsyncOperation, return_type):
 
     """
     loop = asyncio.get_event_loop()
-    done = asyncio.Event()
-    # Register AsyncOperationCompletedHandler callback that triggers the above asyncio.Event.
-    op.Completed = AsyncOperationCompletedHandler[return_type](
-        lambda x, y: loop.call_soon_threadsafe(done.set)
+    future = loop.create_future()
+    # Register AsyncOperationCompletedHandler callback that completes the above asyncio.Future.
+    op.Completed = _completed_handler_type(return_type)(
+        lambda x, y: loop.call_soon_threadsafe(_deliver_async_operation, future, op)
     )
-    # Wait for callback.
-    await done.wait()
+    return await future
+
+
+def _array_to_bytes(b) -> bytes:
+    # Converting a System.Byte[] with bytes() goes through pythonnet element by
+    # element; the pinned array is instead copied to bytes in one memcpy.
+    handle = GCHandle.Alloc(b, GCHandleType.Pinned)
+    try:
+        return ctypes.string_at(handle.AddrOfPinnedObject().ToInt64(), b.Length)
+    finally:
+        handle.Free()
+
+
+def _array_to_bytearray(b) -> bytearray:
+    # Like _array_to_bytes, but copies into the bytearray directly instead of
+    # through an intermediate bytes object.
+    out = bytearray(b.Length)
+    handle = GCHandle.Alloc(b, GCHandleType.Pinned)
+    try:
+        ctypes.memmove(
+            (ctypes.c_char * b.Length).from_buffer(out),
+            handle.AddrOfPinnedObject().ToInt64(),
+            b.Length,
+        )
+    finally:
+        handle.Free()
+    return out
+
+
+def read_buffer(buffer_com_object) -> bytes:
+    """Copy the contents of a ``Windows.Storage.Streams.IBuffer`` to ``bytes``.
+
+    Does the same as reading once with :py:class:`BleakDataReader`, but without
+    allocating a ``DataReader``: the buffer is copied to a single ``System.Byte[]``,
+    for one-shot reads of many small buffers.
 
-    if op.Status == AsyncStatus.Completed:
-        return op.GetResults()
-    elif op.Status == AsyncStatus.Error:
-        # Exception occurred. Wrap it in BleakDotNetTaskError
-        # to make it catchable.
-        raise BleakDotNetTaskError(op.ErrorCode.ToString())
-    else:
-        # TODO: Handle IsCancelled.
-        raise BleakDotNetTaskError("IAsyncOperation Status: {0}".format(op.Status))
+    Args:
+        buffer_com_object: The buffer to read.
+
+    Returns:
+        The buffer contents.
+
+    """
+    # The out parameter of CopyToByteArray is returned by pythonnet.
+    b = CryptographicBuffer.CopyToByteArray(IBuffer(buffer_com_object), None)
+    return _array_to_bytes(b) if b else b""
+
+
+def read_bytearray(buffer_com_object) -> bytearray:
+    """Copy the contents of a ``Windows.Storage.Streams.IBuffer`` to a ``bytearray``.
+
+    Same as ``bytearray(read_buffer(buffer_com_object))``, with one copy less.
+
+    Args:
+        buffer_com_object: The buffer to read.
+
+    Returns:
+        The buffer contents.
+
+    """
+    b = CryptographicBuffer.CopyToByteArray(IBuffer(buffer_com_object), None)
+    return _array_to_bytearray(b) if b else bytearray()
+
+
+def create_buffer(data) -> IBuffer:
+    """Create a ``Windows.Storage.Streams.IBuffer`` holding a copy of ``data``.
+
+    Unlike :py:class:`BleakDataWriter`, no ``DataWriter`` is allocated: the
+    buffer is created straight from a single ``System.Byte[]`` copy.
+
+    Args:
+        data (bytes or bytearray): The data to copy.
+
+    Returns:
+        The new buffer.
+
+    """
+    return CryptographicBuffer.CreateFromByteArray(Array[Byte](data))
 
 
 class BleakDataReader:
@@ -101,7 +202,7 @@ class BleakDataReader:
     def read(self) -> bytes:
         b = Array.CreateInstance(Byte, self.reader.UnconsumedBufferLength)
         self.reader.ReadBytes(b)
-        py_b = bytes(b)
+        py_b = _array_to_bytes(b) if b.Length else b""
         del b
         return py_b
 
@@ -70,18 +70,48 @@ class BaseBleakScanner(abc.ABC):
     async def discover(cls, timeout=5.0, **kwargs) -> List[BLEDevice]:
         """Scan continuously for ``timeout`` seconds and return discovered devices.
 
+        Scanning can be stopped before ``timeout`` by giving ``stop_when`` or ``min_devices``.
+
         Args:
             timeout: Time to scan for.
 
         Keyword Args:
+            stop_when (callable): A function taking a :class:`BLEDevice` and an :class:`AdvertisementData`.
+                Scanning stops as soon as it returns ``True``.
+            min_devices (int): Stop scanning as soon as this many distinct devices have been detected.
             **kwargs: Implementations might offer additional keyword arguments sent to the constructor of the
                       BleakScanner class.
 
         Returns:
 
         """
-        async with cls(**kwargs) as scanner:
-            await asyncio.sleep(timeout)
+        stop_when = kwargs.pop("stop_when", None)
+        min_devices = kwargs.pop("min_devices", None)
+
+        if stop_when is None and min_devices is None:
+            async with cls(**kwargs) as scanner:
+                await asyncio.sleep(timeout)
+                devices = await scanner.get_discovered_devices()
+            return devices
+
+        stop_scanning_event = asyncio.Event()
+        detected = set()
+        user_callback = kwargs.pop("detection_callback", None)
+
+        def stop_if_done(d: BLEDevice, ad: AdvertisementData):
+            if user_callback is not None:
+                user_callback(d, ad)
+            detected.add(d.address)
+            if (stop_when is not None and stop_when(d, ad)) or (
+                min_devices is not None and len(detected) >= min_devices
+            ):
+                stop_scanning_event.set()
+
+        async with cls(detection_callback=stop_if_done, **kwargs) as scanner:
+            try:
+                await asyncio.wait_for(stop_scanning_event.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
             devices = await scanner.get_discovered_devices()
         return devices
 
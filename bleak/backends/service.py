@@ -7,7 +7,7 @@ Created on 2019-03-19 by hbldh <henrik.blidh@nedomkull.com>
 """
 import abc
 from uuid import UUID
-from typing import List, Union, Iterator
+from typing import Iterable, List, Union, Iterator
 
 from bleak import BleakError
 from bleak.uuids import uuidstr_to_str
@@ -69,12 +69,23 @@ class BleakGATTService(abc.ABC):
             return None
 
 
+def _check_all_new(new: dict, count: int, present: dict, kind: str):
+    # ``new`` has fewer than ``count`` keys if some were given more than once.
+    if len(new) != count or not new.keys().isdisjoint(present):
+        raise BleakError(
+            "This {0} is already present in this BleakGATTServiceCollection!".format(
+                kind
+            )
+        )
+
+
 class BleakGATTServiceCollection(object):
     """Simple data container for storing the peripheral's service complement."""
 
     def __init__(self):
         self.__services = {}
         self.__characteristics = {}
+        self.__characteristics_by_uuid = {}
         self.__descriptors = {}
 
     def __getitem__(
@@ -127,6 +138,9 @@ class BleakGATTServiceCollection(object):
         """
         if characteristic.handle not in self.__characteristics:
             self.__characteristics[characteristic.handle] = characteristic
+            self.__characteristics_by_uuid.setdefault(characteristic.uuid, []).append(
+                characteristic
+            )
             self.__services[characteristic.service_uuid].add_characteristic(
                 characteristic
             )
@@ -143,12 +157,7 @@ class BleakGATTServiceCollection(object):
             return self.characteristics.get(specifier, None)
         else:
             # Assume uuid usage.
-            x = list(
-                filter(
-                    lambda x: x.uuid == str(specifier).lower(),
-                    self.characteristics.values(),
-                )
-            )
+            x = self.__characteristics_by_uuid.get(str(specifier).lower(), ())
             if len(x) > 1:
                 raise BleakError(
                     "Multiple Characteristics with this UUID, refer to your desired characteristic by the `handle` attribute instead."
@@ -171,6 +180,76 @@ class BleakGATTServiceCollection(object):
                 "This descriptor is already present in this BleakGATTServiceCollection!"
             )
 
+    def add_all(
+        self,
+        services: Iterable[BleakGATTService],
+        characteristics: Iterable[BleakGATTCharacteristic] = (),
+        descriptors: Iterable[BleakGATTDescriptor] = (),
+    ):
+        """Add services, characteristics and descriptors to the service collection at once.
+
+        Does the same as calling :py:meth:`add_service`, :py:meth:`add_characteristic`
+        and :py:meth:`add_descriptor` for each of them in turn, but nothing is added if
+        any of them is already present or belongs to a service or characteristic
+        that is neither given nor already present.
+
+        Should not be used by end user, but rather by `bleak` itself.
+        """
+        services = list(services)
+        characteristics = list(characteristics)
+        descriptors = list(descriptors)
+
+        new_services = {s.uuid: s for s in services}
+        _check_all_new(new_services, len(services), self.__services, "service")
+        new_characteristics = {c.handle: c for c in characteristics}
+        _check_all_new(
+            new_characteristics,
+            len(characteristics),
+            self.__characteristics,
+            "characteristic",
+        )
+        new_descriptors = {d.handle: d for d in descriptors}
+        _check_all_new(
+            new_descriptors, len(descriptors), self.__descriptors, "descriptor"
+        )
+        for characteristic in characteristics:
+            if (
+                characteristic.service_uuid not in new_services
+                and characteristic.service_uuid not in self.__services
+            ):
+                raise BleakError(
+                    "Service {0} of characteristic {1} is not present in this "
+                    "BleakGATTServiceCollection!".format(
+                        characteristic.service_uuid, characteristic.handle
+                    )
+                )
+        for descriptor in descriptors:
+            if (
+                descriptor.characteristic_handle not in new_characteristics
+                and descriptor.characteristic_handle not in self.__characteristics
+            ):
+                raise BleakError(
+                    "Characteristic {0} of descriptor {1} is not present in this "
+                    "BleakGATTServiceCollection!".format(
+                        descriptor.characteristic_handle, descriptor.handle
+                    )
+                )
+
+        self.__services.update(new_services)
+        self.__characteristics.update(new_characteristics)
+        self.__descriptors.update(new_descriptors)
+
+        all_services = self.__services
+        by_uuid = self.__characteristics_by_uuid
+        for characteristic in characteristics:
+            by_uuid.setdefault(characteristic.uuid, []).append(characteristic)
+            all_services[characteristic.service_uuid].add_characteristic(characteristic)
+        all_characteristics = self.__characteristics
+        for descriptor in descriptors:
+            all_characteristics[descriptor.characteristic_handle].add_descriptor(
+                descriptor
+            )
+
     def get_descriptor(self, handle: int) -> BleakGATTDescriptor:
         """Get a descriptor by integer handle"""
         return self.descriptors.get(handle, None)
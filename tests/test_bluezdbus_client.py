@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `bleak.backends.bluezdbus.client` module."""
+
+import pytest
+
+client = pytest.importorskip("bleak.backends.bluezdbus.client")
+
+
+class FakeMessage:
+    """A PropertiesChanged signal message as delivered by txdbus."""
+
+    def __init__(self, path, body):
+        self.path = path
+        self.body = body
+
+
+CHAR_PATH = "/org/bluez/hci0/dev_00_11_22_33_44_55/service000c/char000d"
+
+
+def test_data_notification_wrapper():
+    """Test that notifications reach the callback as (handle, bytearray)."""
+    calls = []
+    wrapper = client._data_notification_wrapper(lambda *args: calls.append(args), 13)
+    message = FakeMessage(
+        CHAR_PATH,
+        ["org.bluez.GattCharacteristic1", {"Value": [1, 2, 3]}, []],
+    )
+    wrapper(message.body[1])
+    # Changes of other properties of the characteristic are not notifications.
+    wrapper({"Notifying": True})
+    assert calls == [(13, bytearray(b"\x01\x02\x03"))]
+    assert type(calls[0][1]) is bytearray
+
+
+def test_regular_notification_wrapper():
+    """Test that the unwrapped callback gets the handle and the changed properties."""
+    calls = []
+    wrapper = client._regular_notification_wrapper(lambda *args: calls.append(args), 13)
+    message = FakeMessage(
+        CHAR_PATH,
+        ["org.bluez.GattCharacteristic1", {"Value": [1, 2, 3]}, []],
+    )
+    wrapper(message.body[1])
+    assert calls == [(13, {"Value": [1, 2, 3]})]
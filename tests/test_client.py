@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `bleak.backends.client` module."""
+
+import asyncio
+import threading
+
+from bleak.backends.client import batched_call_soon_threadsafe
+
+
+def test_batched_call_soon_threadsafe():
+    """Test that calls from another thread run in the loop in order, past errors."""
+    loop = asyncio.new_event_loop()
+    calls = []
+    errors = []
+    loop.set_exception_handler(lambda loop, context: errors.append(context))
+
+    def func(i):
+        calls.append((i, threading.current_thread()))
+        if i == 99:
+            loop.stop()
+        if i == 50:
+            raise ValueError(i)
+
+    call = batched_call_soon_threadsafe(loop, func)
+    thread = threading.Thread(target=lambda: [call(i) for i in range(100)])
+    try:
+        thread.start()
+        loop.run_forever()
+    finally:
+        thread.join()
+        loop.close()
+    assert [i for i, _ in calls] == list(range(100))
+    assert all(t is threading.main_thread() for _, t in calls)
+    assert [e["exception"].args for e in errors] == [(50,)]
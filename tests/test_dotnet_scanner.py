@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `bleak.backends.dotnet.scanner` module."""
+
+import pytest
+
+scanner = pytest.importorskip("bleak.backends.dotnet.scanner")
+
+
+class FakeAdvertisement:
+    def __init__(self, local_name):
+        self.LocalName = local_name
+
+
+class FakeEventArgs:
+    def __init__(self, address, advertisement_type=None, local_name=""):
+        self.BluetoothAddress = address
+        self.AdvertisementType = advertisement_type
+        self.Advertisement = FakeAdvertisement(local_name)
+
+
+@pytest.mark.parametrize(
+    "address", [0, 0xFFFFFFFFFFFF, 0x000102030405, 0x0000000000AB, 0x00FF00FF00FF]
+)
+def test_format_bdaddr(address):
+    """Test that addresses are formatted as by ``int.to_bytes``, byte by byte."""
+    expected = ":".join("{:02X}".format(x) for x in address.to_bytes(6, "big"))
+    assert scanner._format_bdaddr(address) == expected
+
+
+def _drain(dotnet_scanner, *event_args):
+    dotnet_scanner._advertisements.extend(event_args)
+    dotnet_scanner._drain_advertisements()
+    return list(dotnet_scanner._devices), list(dotnet_scanner._scan_responses)
+
+
+def test_max_devices_evicts_least_recently_seen():
+    """Test that ``max_devices`` drops the least recently seen device and its name."""
+    dotnet_scanner = scanner.BleakScannerDotNet(max_devices=2)
+    devices, scan_responses = _drain(
+        dotnet_scanner,
+        FakeEventArgs(1),
+        FakeEventArgs(1, scanner._SCAN_RESPONSE, "one"),
+        FakeEventArgs(2),
+        FakeEventArgs(2, scanner._SCAN_RESPONSE, "two"),
+        # Seeing device 1 again makes device 2 the least recently seen.
+        FakeEventArgs(1),
+        FakeEventArgs(3),
+    )
+    assert devices == [1, 3]
+    assert scan_responses == [1]
+    assert dotnet_scanner._scan_responses[1] == "one"
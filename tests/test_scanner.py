@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `bleak.backends.scanner` module."""
+
+import asyncio
+from typing import List
+
+from bleak.backends.device import BLEDevice
+from bleak.backends.scanner import AdvertisementData, BaseBleakScanner
+
+
+class FakeScanner(BaseBleakScanner):
+    """Scanner reporting ``advertisements`` 10 ms apart once started."""
+
+    advertisements = []
+
+    def __init__(self, **kwargs):
+        super(FakeScanner, self).__init__(**kwargs)
+        self._devices = {}
+        self._task = None
+
+    async def _report(self):
+        for address, name in self.advertisements:
+            await asyncio.sleep(0.01)
+            device = BLEDevice(address, name)
+            self._devices[address] = device
+            if self._callback is not None:
+                self._callback(device, AdvertisementData(local_name=name))
+
+    async def start(self):
+        self._task = asyncio.ensure_future(self._report())
+
+    async def stop(self):
+        self._task.cancel()
+
+    async def set_scanning_filter(self, **kwargs):
+        pass
+
+    async def get_discovered_devices(self) -> List[BLEDevice]:
+        return list(self._devices.values())
+
+
+def _run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def _scanner(advertisements):
+    return type("Scanner", (FakeScanner,), {"advertisements": advertisements})
+
+
+def test_discover_stop_when():
+    """Test that scanning stops once ``stop_when`` returns True."""
+    scanner = _scanner([("00:01", "a"), ("00:02", "b"), ("00:03", "c")])
+    devices = _run(
+        scanner.discover(timeout=5.0, stop_when=lambda d, ad: ad.local_name == "b")
+    )
+    assert [d.address for d in devices] == ["00:01", "00:02"]
+
+
+def test_discover_min_devices():
+    """Test that scanning stops once ``min_devices`` distinct devices are seen."""
+    scanner = _scanner([("00:01", "a"), ("00:01", "a"), ("00:02", "b"), ("00:03", "c")])
+    devices = _run(scanner.discover(timeout=5.0, min_devices=2))
+    assert sorted(d.address for d in devices) == ["00:01", "00:02"]
+
+
+def test_discover_passes_through_detection_callback():
+    """Test that a user ``detection_callback`` still sees every advertisement."""
+    scanner = _scanner([("00:01", "a"), ("00:02", "b")])
+    seen = []
+    _run(
+        scanner.discover(
+            timeout=5.0,
+            min_devices=2,
+            detection_callback=lambda d, ad: seen.append(d.address),
+        )
+    )
+    assert seen == ["00:01", "00:02"]
+
+
+def test_discover_times_out():
+    """Test that scanning ends at ``timeout`` if the condition is never met."""
+    scanner = _scanner([("00:01", "a")])
+    devices = _run(scanner.discover(timeout=0.1, min_devices=2))
+    assert [d.address for d in devices] == ["00:01"]
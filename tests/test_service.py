@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `bleak.backends.service` module."""
+
+import pytest
+
+from bleak.exc import BleakError
+from bleak.backends.service import BleakGATTServiceCollection
+
+
+class FakeService:
+    def __init__(self, uuid):
+        self.uuid = uuid
+        self.characteristics = []
+
+    def add_characteristic(self, characteristic):
+        self.characteristics.append(characteristic)
+
+
+class FakeCharacteristic:
+    def __init__(self, handle, uuid, service_uuid):
+        self.handle = handle
+        self.uuid = uuid
+        self.service_uuid = service_uuid
+        self.descriptors = []
+
+    def add_descriptor(self, descriptor):
+        self.descriptors.append(descriptor)
+
+
+class FakeDescriptor:
+    def __init__(self, handle, characteristic_handle):
+        self.handle = handle
+        self.characteristic_handle = characteristic_handle
+
+
+SERVICE_UUID = "0000180f-0000-1000-8000-00805f9b34fb"
+CHAR_UUID = "00002a19-0000-1000-8000-00805f9b34fb"
+OTHER_CHAR_UUID = "00002a1a-0000-1000-8000-00805f9b34fb"
+
+
+def _collection():
+    service = FakeService(SERVICE_UUID)
+    characteristics = [
+        FakeCharacteristic(3, CHAR_UUID, SERVICE_UUID),
+        FakeCharacteristic(6, OTHER_CHAR_UUID, SERVICE_UUID),
+    ]
+    collection = BleakGATTServiceCollection()
+    collection.add_service(service)
+    for characteristic in characteristics:
+        collection.add_characteristic(characteristic)
+    return collection, characteristics
+
+
+def test_get_characteristic_by_handle_and_uuid():
+    """Test characteristic lookup by handle and by UUID."""
+    collection, characteristics = _collection()
+    assert collection.get_characteristic(6) is characteristics[1]
+    assert collection.get_characteristic(CHAR_UUID.upper()) is characteristics[0]
+    assert collection.get_characteristic("00002a1b-0000-1000-8000-00805f9b34fb") is None
+
+
+def test_get_characteristic_duplicate_uuid():
+    """Test that a UUID shared by several characteristics is refused."""
+    collection, _ = _collection()
+    collection.add_characteristic(FakeCharacteristic(9, CHAR_UUID, SERVICE_UUID))
+    with pytest.raises(BleakError):
+        collection.get_characteristic(CHAR_UUID)
+    assert collection.get_characteristic(9).handle == 9
+
+
+def test_add_all():
+    """Test that add_all links services, characteristics and descriptors."""
+    service = FakeService(SERVICE_UUID)
+    characteristics = [
+        FakeCharacteristic(3, CHAR_UUID, SERVICE_UUID),
+        FakeCharacteristic(6, OTHER_CHAR_UUID, SERVICE_UUID),
+    ]
+    descriptors = [FakeDescriptor(4, 3)]
+    collection = BleakGATTServiceCollection()
+    collection.add_all([service], characteristics, descriptors)
+    assert collection.get_service(SERVICE_UUID) is service
+    assert service.characteristics == characteristics
+    assert characteristics[0].descriptors == descriptors
+    assert collection.get_descriptor(4) is descriptors[0]
+
+
+def test_add_all_already_present():
+    """Test that add_all adds nothing if any item is already present."""
+    collection, _ = _collection()
+    with pytest.raises(BleakError):
+        collection.add_all(
+            [FakeService("00001800-0000-1000-8000-00805f9b34fb")],
+            [FakeCharacteristic(3, CHAR_UUID, SERVICE_UUID)],
+        )
+    assert list(collection.services) == [SERVICE_UUID]
+    assert len(collection.get_service(SERVICE_UUID).characteristics) == 2
+
+
+def test_add_all_missing_parent():
+    """Test that add_all adds nothing if a characteristic has no known service."""
+    collection = BleakGATTServiceCollection()
+    with pytest.raises(BleakError):
+        collection.add_all(
+            [FakeService(SERVICE_UUID)],
+            [
+                FakeCharacteristic(3, CHAR_UUID, SERVICE_UUID),
+                FakeCharacteristic(6, OTHER_CHAR_UUID, "unknown"),
+            ],
+        )
+    assert collection.services == {}
+    assert collection.characteristics == {}
+    with pytest.raises(BleakError):
+        collection.add_all([FakeService(SERVICE_UUID)], (), [FakeDescriptor(4, 3)])
+    assert collection.descriptors == {}